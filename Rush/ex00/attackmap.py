@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# แผนที่การตี: ทุกช่องบนบอร์ดถูกศัตรูตัวไหนตีบ้าง คำนวณรอบเดียวด้วยตาราง ray
+# เดียวกับ checkmate (ray_table) แทนที่จะเรียก checkmate() ทีละช่อง
+from checkmate import EMPTY, KING, ERRORS, parse_into, ray_table
+
+
+class AttackMap:
+    """masks[square] เป็น bitmask ของศัตรูที่ตีช่องนั้น: bit i คือ pieces[i]
+    pieces เป็น list ของ (ตัวหมาก, ช่อง) เรียงตามช่องบนบอร์ด
+    ช่องที่มีตัวหมากอยู่ก็นับว่าถูกตีได้ (คือตัวนั้นมีตัวอื่นคุ้มกันอยู่)"""
+
+    __slots__ = ("n", "pieces", "masks")
+
+    def __init__(self, n, pieces, masks):
+        self.n = n
+        self.pieces = pieces
+        self.masks = masks
+
+    @classmethod
+    def from_cells(cls, cells, n, transparent=None):
+        """สร้างจากบอร์ดแบบแบน (ช่องว่างเป็น '.')
+        transparent: ช่องที่ให้ ray วิ่งทะลุได้เหมือนช่องว่าง เช่นช่องของ King
+        เวลาอยากรู้ว่า King ถอยไปตามแนวที่ถูกตีแล้วจะยังโดนอยู่ไหม"""
+        rays = ray_table(n)
+        pieces = []
+        masks = [0] * (n * n)
+        for square in range(n * n):
+            code = cells[square]
+            if code == EMPTY or code == KING:
+                continue
+            piece = chr(code)
+            bit = 1 << len(pieces)
+            pieces.append((piece, square))
+            for ray in rays[piece][square]:
+                for cur in ray:
+                    masks[cur] |= bit
+                    if cells[cur] != EMPTY and cur != transparent:
+                        break
+        return cls(n, pieces, masks)
+
+    @classmethod
+    def from_board(cls, board, large=False):
+        """สร้างจากบอร์ดข้อความด้วย parse เดียวกับ checkmate()
+        ไม่ต้องมี King ก็ได้ แต่บอร์ดที่ผิดแบบอื่นจะได้ ValueError"""
+        cells = bytearray()
+        n, _, error = parse_into(board, cells, [], large=large)
+        if error is not None and error != "no_king":
+            raise ValueError(ERRORS[error])
+        return cls.from_cells(cells, n)
+
+    def _index(self, square):
+        r, c = square
+        if not (0 <= r < self.n and 0 <= c < self.n):
+            raise ValueError("square %r is off the board" % (square,))
+        return r * self.n + c
+
+    def is_attacked(self, square):
+        """ช่อง (r, c) ถูกศัตรูตัวใดตัวหนึ่งตีอยู่ไหม"""
+        return self.masks[self._index(square)] != 0
+
+    def attackers(self, square):
+        """list ของ (ตัวหมาก, (r, c)) ที่ตีช่อง square"""
+        mask = self.masks[self._index(square)]
+        found = []
+        i = 0
+        while mask:
+            if mask & 1:
+                piece, at = self.pieces[i]
+                found.append((piece, divmod(at, self.n)))
+            mask >>= 1
+            i += 1
+        return found
+
+    def attacked_squares(self):
+        """ทุกช่อง (r, c) ที่ถูกตี เรียงตามแถว"""
+        return [divmod(square, self.n) for square, mask in enumerate(self.masks) if mask]
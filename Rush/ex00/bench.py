@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# วัดความเร็วของแต่ละ engine บนบอร์ดสุ่มแบบกำหนด seed แล้ว print ผลเป็น JSON
+# ใช้เทียบกันระหว่าง version:  python bench.py --boards 2000 -o bench.json
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+from checkmate import ENGINES, evaluate
+from generator import board_with_verdict, random_board
+import vectorized
+
+# บอร์ดจาก test_evil.py
+ENCLOSED_QUEEN = """\
+.......
+.......
+..PPP..
+..PQP..
+..PPP..
+.......
+......K"""
+
+ALL_PAWNS = """\
+..K..
+.....
+PPPPP
+.....
+....."""
+
+
+def _broken(rng):
+    board = random_board(rng, rng.randint(2, 8), 0.2)
+    if rng.random() < 0.5:
+        return board + "\n" + "." * rng.randint(1, 9)  # ไม่เป็นสี่เหลี่ยมจัตุรัส
+    return board.replace(".", "K", 1)                  # King สองตัว
+
+
+# ชื่อ scenario -> (ฟังก์ชันสร้างบอร์ดหนึ่งกระดาน, ต้องใช้ large=True ไหม)
+SCENARIOS = {
+    "sizes-1-8": (lambda rng: random_board(rng, rng.randint(1, 8), 0.2), False),
+    "sparse-8x8": (lambda rng: random_board(rng, 8, 0.08), False),
+    "dense-8x8": (lambda rng: random_board(rng, 8, 0.6), False),
+    "attacked-8x8": (lambda rng: board_with_verdict(rng, 8, "attacked"), False),
+    "safe-8x8": (lambda rng: board_with_verdict(rng, 8, "safe"), False),
+    "junk-8x8": (lambda rng: random_board(rng, 8, 0.15, junk=0.3), False),
+    "errors": (_broken, False),
+    "enclosed-queen": (lambda rng: ENCLOSED_QUEEN, False),
+    "all-pawns": (lambda rng: ALL_PAWNS, False),
+    "large-16": (lambda rng: random_board(rng, 16, 0.1), True),
+    "large-64": (lambda rng: random_board(rng, 64, 0.02), True),
+}
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+def measure(boards, engine, large):
+    """ตรวจ boards ด้วย engine คืนสถิติเป็น dict
+    รันรอบแรกแบบไม่จับเวลาก่อน ให้ของที่สร้างครั้งเดียวแล้ว cache ไว้
+    (เช่น ray_table ของแต่ละขนาด) ไม่ไปตกอยู่กับ engine ที่บังเอิญวัดก่อน"""
+    if engine == "vectorized":
+        run = lambda: vectorized.evaluate_many(boards, large=large)
+    else:
+        run = lambda: [evaluate(b, engine=engine, large=large) for b in boards]
+    run()
+
+    if engine == "vectorized":
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+        latencies = None
+    else:
+        latencies = []
+        for board in boards:
+            start = time.perf_counter_ns()
+            evaluate(board, engine=engine, large=large)
+            latencies.append(time.perf_counter_ns() - start)
+        seconds = sum(latencies) / 1e9
+
+    # วัด memory อีกรอบแยกกัน เพราะ tracemalloc ทำให้ช้าลง
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    stats = {
+        "boards": len(boards),
+        "seconds": round(seconds, 6),
+        "boards_per_sec": round(len(boards) / seconds, 1) if seconds else None,
+        "p50_us": None,
+        "p99_us": None,
+        "peak_kib": round(peak / 1024, 1),
+    }
+    if latencies:
+        latencies.sort()
+        stats["p50_us"] = round(_percentile(latencies, 0.50) / 1000, 2)
+        stats["p99_us"] = round(_percentile(latencies, 0.99) / 1000, 2)
+    return stats
+
+
+def run_benchmarks(count=1000, seed=0, scenarios=None, engines=None):
+    """รันทุก scenario x engine คืน dict ที่พร้อมแปลงเป็น JSON"""
+    if engines is None:
+        engines = ["auto"] + list(ENGINES)
+        if vectorized.np is not None:
+            engines.append("vectorized")
+    report = {
+        "python": platform.python_version(),
+        "seed": seed,
+        "boards": count,
+        "scenarios": {},
+    }
+    for name in scenarios or SCENARIOS:
+        make, large = SCENARIOS[name]
+        rng = random.Random("%s:%s" % (seed, name))
+        boards = [make(rng) for _ in range(count)]
+        report["scenarios"][name] = {
+            engine: measure(boards, engine, large) for engine in engines}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="benchmark checkmate engines")
+    parser.add_argument("--boards", type=int, default=1000,
+                        help="จำนวนบอร์ดต่อ scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="เลือกเฉพาะบาง scenario (ใส่ได้หลายครั้ง)")
+    parser.add_argument("--engine", action="append",
+                        choices=["auto", "vectorized"] + list(ENGINES),
+                        help="เลือกเฉพาะบาง engine (ใส่ได้หลายครั้ง)")
+    parser.add_argument("-o", "--output", help="เขียน JSON ลงไฟล์แทน stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.boards, args.seed, args.scenario, args.engine)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
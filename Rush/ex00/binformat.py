@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# ไฟล์บอร์ดแบบ binary ขนาดคงที่ เปิดด้วย mmap แล้วส่งแต่ละบอร์ดให้ engine
+# โดยไม่ต้อง parse ข้อความ (engine copy record ออกมาเป็น bytes ที่ normalize แล้ว
+# บอร์ดละครั้ง ด้วย translate รอบเดียว)
+# header 8 byte: MAGIC (4) + VERSION (1) + ขนาดบอร์ด n (1) + สำรอง (2)
+# ตามด้วย record ละ n * n byte ช่องละ 1 byte เป็นตัวอักษร ASCII ('.' = ช่องว่าง)
+import mmap
+
+from checkmate import _NORMALIZE, evaluate_cells_many
+
+MAGIC = b"CKMB"
+VERSION = 1
+HEADER_SIZE = 8
+
+
+def encode_board(board, n):
+    """แปลงบอร์ดข้อความเป็น record ขนาด n * n byte"""
+    rows = board.splitlines()
+    if len(rows) != n or any(len(row) != n for row in rows):
+        raise ValueError("board is not %dx%d" % (n, n))
+    # ตัวอักษรที่ไม่ใช่ ASCII เป็นช่องว่างอยู่แล้ว แทนด้วย '?' ก่อน
+    # แล้ว normalize ด้วยตารางเดียวกับ checkmate()
+    record = "".join(rows).encode("ascii", "replace")
+    return record.translate(_NORMALIZE)
+
+
+def write_boards(path, boards, n):
+    """เขียนบอร์ดข้อความขนาด n x n ลงไฟล์ binary คืนจำนวนบอร์ดที่เขียน"""
+    if not 1 <= n <= 255:
+        raise ValueError("board size must be between 1 and 255")
+    count = 0
+    with open(path, "wb") as f:
+        f.write(MAGIC + bytes((VERSION, n, 0, 0)))
+        for board in boards:
+            f.write(encode_board(board, n))
+            count += 1
+    return count
+
+
+def read_records(path):
+    """yield (n, record) ทีละบอร์ด record เป็น memoryview ของ mmap (ไม่ copy)
+    record ใช้ได้ถึงแค่รอบถัดไปเท่านั้น ถ้าจะเก็บไว้ให้ bytes(record)
+    ไฟล์ที่ record สุดท้ายไม่ครบได้ ValueError (ก่อนจะ yield อะไรเลย)"""
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) != HEADER_SIZE or header[:4] != MAGIC:
+            raise ValueError("%s: not a board file" % (path,))
+        if header[4] != VERSION:
+            raise ValueError("%s: unsupported version %d" % (path, header[4]))
+        n = header[5]
+        size = n * n
+        if size == 0:
+            raise ValueError("%s: board size is 0" % (path,))
+        length = f.seek(0, 2)
+        if (length - HEADER_SIZE) % size:
+            raise ValueError("%s: truncated record at end of file" % (path,))
+        if length == HEADER_SIZE:
+            return  # ไฟล์ไม่มีบอร์ด mmap ไฟล์ขนาด 0 record ไม่ได้
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                for start in range(HEADER_SIZE, len(mm) - size + 1, size):
+                    record = view[start:start + size]
+                    try:
+                        yield n, record
+                    finally:
+                        record.release()
+
+
+def check_file(path, engine="auto", large=False):
+    """ตรวจทุกบอร์ดในไฟล์ binary yield Result ทีละบอร์ด"""
+    return evaluate_cells_many(read_records(path), engine=engine, large=large)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# Bitboard engine สำหรับบอร์ดไม่เกิน 8x8
+# ช่อง (r, c) คือ bit ที่ r * 8 + c เสมอ ถึงบอร์ดจะเล็กกว่า 8x8 ก็ตาม
+# (ช่องที่เกินขอบบอร์ดจริงเป็นช่องว่าง ray วิ่งผ่านไปแล้วก็หลุดขอบ 8x8 เอง)
+
+MAX_SIZE = 8
+
+
+def _ray_masks(dr, dc):
+    """masks[square] = ทุกช่องจาก square ไปในทิศ (dr, dc) จนสุดขอบ 8x8"""
+    masks = []
+    for square in range(64):
+        r, c = divmod(square, 8)
+        mask = 0
+        r += dr
+        c += dc
+        while 0 <= r < 8 and 0 <= c < 8:
+            mask |= 1 << (r * 8 + c)
+            r += dr
+            c += dc
+        masks.append(mask)
+    return tuple(masks)
+
+
+def _pawn_sources(square):
+    """ช่องที่ Pawn ต้องยืนอยู่ถึงจะตี square ได้ (ทแยงลงล่าง 1 ช่อง)"""
+    r, c = divmod(square, 8)
+    mask = 0
+    for dc in (-1, 1):
+        if r + 1 < 8 and 0 <= c + dc < 8:
+            mask |= 1 << ((r + 1) * 8 + c + dc)
+    return mask
+
+
+# ray จากแต่ละช่อง: (masks, ตัวขวางตัวแรกคือ bit ต่ำสุดไหม)
+# ทิศที่ลงล่างหรือไปขวา bit index เพิ่มขึ้น ตัวแรกจึงเป็น bit ต่ำสุด
+ORTHOGONAL_RAYS = tuple((_ray_masks(dr, dc), dr * 8 + dc > 0)
+                        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)))
+DIAGONAL_RAYS = tuple((_ray_masks(dr, dc), dr * 8 + dc > 0)
+                      for dr, dc in ((-1, -1), (-1, 1), (1, -1), (1, 1)))
+# ทุกช่องในแนวตรง / แนวทแยงของแต่ละช่อง ไว้ดูก่อนว่ามีตัวตีได้อยู่ในแนวไหม
+ORTHOGONAL_LINES = tuple(sum(masks[square] for masks, _ in ORTHOGONAL_RAYS)
+                         for square in range(64))
+DIAGONAL_LINES = tuple(sum(masks[square] for masks, _ in DIAGONAL_RAYS)
+                       for square in range(64))
+PAWN_SOURCE_MASKS = tuple(_pawn_sources(square) for square in range(64))
+
+# ตาราง translate บอร์ดแบบแบนเป็นเลขฐานสอง '1' = ช่องที่ต้องการ
+def _bits(pieces):
+    return bytes(ord('1') if b in pieces else ord('0') for b in range(256))
+
+_PAWN_BITS = _bits(b"P")
+_ORTHOGONAL_BITS = _bits(b"RQ")
+_DIAGONAL_BITS = _bits(b"BQ")
+_OCCUPIED_BITS = _bits(b"PBRQK")
+_PADDING = b"." * 64
+
+
+def from_cells(cells, n):
+    """แปลงบอร์ดแบบแบน (ช่องละ 1 byte) เป็น (pawns, orthogonal, diagonal, occupied)
+    orthogonal = Rook | Queen, diagonal = Bishop | Queen
+    ใช้ translate + int(..., 2) ทำทีละทั้งบอร์ด ไม่ต้องวนทีละตัวใน Python"""
+    if n == 8:
+        board = cells[::-1]
+    else:
+        board = bytearray(_PADDING)
+        for r in range(n):
+            board[r * 8:r * 8 + n] = cells[r * n:(r + 1) * n]
+        board.reverse()
+    # กลับด้านแล้ว ช่อง 0 อยู่ท้ายสุด = bit ต่ำสุดของเลขฐานสอง
+    return (int(board.translate(_PAWN_BITS), 2),
+            int(board.translate(_ORTHOGONAL_BITS), 2),
+            int(board.translate(_DIAGONAL_BITS), 2),
+            int(board.translate(_OCCUPIED_BITS), 2))
+
+
+def attacker_of(square, pawns, orthogonal, diagonal, occupied):
+    """bit index ของตัวที่ตีช่อง square (r * 8 + c) หรือ None
+    ดูตัวขวางตัวแรกในแต่ละทิศจากตาราง ray ทิศละไม่กี่ bit op
+    และข้ามทั้งแนวถ้าไม่มีตัวที่ตีได้อยู่ในแนวนั้นเลย"""
+    hit = pawns & PAWN_SOURCE_MASKS[square]
+    if hit:
+        return (hit & -hit).bit_length() - 1
+    for sliders, rays, lines in ((orthogonal, ORTHOGONAL_RAYS, ORTHOGONAL_LINES),
+                                 (diagonal, DIAGONAL_RAYS, DIAGONAL_LINES)):
+        if not sliders & lines[square]:
+            continue
+        for masks, lowest in rays:
+            blockers = masks[square] & occupied
+            if blockers:
+                if lowest:
+                    first = blockers & -blockers
+                else:
+                    first = 1 << (blockers.bit_length() - 1)
+                if first & sliders:
+                    return first.bit_length() - 1
+    return None
+
+
+def attacker_of_counted(square, pawns, orthogonal, diagonal, occupied, stats):
+    """attacker_of ที่นับลง stats (checkmate.Stats): ทุกทิศที่ดูนับเป็น ray
+    (การดู Pawn นับเป็น 1 ray) ทิศที่ตัวแรกที่ขวางตี King ไม่ได้นับเป็น blocked
+    ไม่มีการเดินทีละช่อง จึงไม่นับ squares"""
+    stats.rays += 1
+    hit = pawns & PAWN_SOURCE_MASKS[square]
+    if hit:
+        return (hit & -hit).bit_length() - 1
+    for sliders, rays, lines in ((orthogonal, ORTHOGONAL_RAYS, ORTHOGONAL_LINES),
+                                 (diagonal, DIAGONAL_RAYS, DIAGONAL_LINES)):
+        if not sliders & lines[square]:
+            continue
+        for masks, lowest in rays:
+            stats.rays += 1
+            blockers = masks[square] & occupied
+            if blockers:
+                if lowest:
+                    first = blockers & -blockers
+                else:
+                    first = 1 << (blockers.bit_length() - 1)
+                if first & sliders:
+                    return first.bit_length() - 1
+                stats.blocked += 1
+    return None
+
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# cache ผลการตรวจ ใช้กับ evaluate(..., cache=...) / checkmate_many(..., cache=...)
+import re
+from collections import OrderedDict
+
+# ตัวที่ไม่ใช่ PBRQK เป็นช่องว่างเหมือนกันหมด ('\n' คือตัวคั่นแถว)
+_JUNK = re.compile(r"[^PBRQK\n]")
+# ตาราง translate ของ key: PBRQK และ '\n' คงเดิม ตัวอื่นเป็น '.'
+# ตัวขึ้นบรรทัดแบบอื่นที่ splitlines() รู้จักเป็น '\r' ไว้ส่งไปทางช้า
+_KEY_TABLE = bytes(b if b in b"PBRQK\n" else
+                   ord("\r") if b in b"\r\x0b\x0c\x1c\x1d\x1e" else ord(".")
+                   for b in range(256))
+
+POLICIES = ("lru", "fifo")
+
+
+def cache_key(board, large=False):
+    """key (bytes) ของบอร์ดหลังแปลงตัวอื่นเป็น '.' และรวมแถวด้วย '\\n'
+    บอร์ดที่ต่างกันแค่ตัวขยะหรือแบบขึ้นบรรทัดได้ key เดียวกัน
+    large=True ได้ key แยกกัน เพราะบอร์ดเกิน MAX_SIZE ได้ผลไม่เหมือนกัน
+
+    บอร์ด ASCII ที่ขึ้นบรรทัดด้วย '\\n' อย่างเดียว (กรณีปกติ) ใช้ translate
+    ครั้งเดียวแบบเดียวกับ parse_into ไม่ต้องแยกแถว"""
+    key = None
+    if not board:
+        key = b"\0"  # ไม่มีแถวเลย ต่างจาก "\n" ที่มีแถวว่าง 1 แถว ('\0' ไม่มีใน key อื่น)
+    elif board.isascii():
+        key = board.encode("ascii").translate(_KEY_TABLE)
+        if b"\r" in key:
+            key = None
+        elif key.endswith(b"\n"):
+            key = key[:-1]  # splitlines() ไม่นับ '\n' ตัวสุดท้ายเป็นแถวใหม่
+    if key is None:
+        key = _JUNK.sub(".", "\n".join(board.splitlines())).encode("ascii")
+    if large:
+        return (key, True)
+    return key
+
+
+class VerdictCache:
+    """cache ขนาดจำกัด เก็บ Result ตาม cache_key ของบอร์ด
+    policy "lru" ทิ้งตัวที่ไม่ได้ใช้นานที่สุด, "fifo" ทิ้งตัวที่ใส่ก่อนสุด
+    ควรใช้ cache หนึ่งตัวกับ engine เดียว (ตัวที่ตี King ที่รายงานอาจต่างกันตาม engine)"""
+
+    def __init__(self, maxsize=65536, policy="lru"):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if policy not in POLICIES:
+            raise ValueError("unknown policy: %r" % (policy,))
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    key = staticmethod(cache_key)
+
+    def get(self, key):
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key, result):
+        self._entries[key] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "size": len(self._entries),
+                "maxsize": self.maxsize, "policy": self.policy}
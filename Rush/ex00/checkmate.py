@@ -1,63 +1,555 @@
 #!/usr/bin/env python3
-def checkmate(board):
+import os
+import sys
+import time
+from itertools import compress
+
+import bitboard
+from lineindex import LineIndex
+
+# ทิศทางการเดินของแต่ละตัว (แถว, คอลัมน์)
+DIRECTIONS = {
+    'P': ((-1, -1), (-1, 1)),
+    'R': ((-1, 0), (1, 0), (0, -1), (0, 1)),
+    'B': ((-1, -1), (-1, 1), (1, -1), (1, 1)),
+    'Q': ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)),
+}
+
+# บอร์ดแบบแบนเก็บเป็น bytes ช่องละ 1 byte (ตัวอักษร ASCII) ช่องว่างคือ '.'
+EMPTY = ord('.')
+PAWN = ord('P')
+KING = ord('K')
+
+# ตาราง translate: ตัวที่ไม่ใช่ PBRQK เป็น '.'
+_NORMALIZE = bytes(b if b in b"PBRQK" else EMPTY for b in range(256))
+# ตาราง translate: ศัตรู (PBRQ) เป็น 1 ที่เหลือเป็น 0 ใช้เลือกช่องด้วย compress
+_ENEMY_MASK = bytes(1 if b in b"PBRQ" else 0 for b in range(256))
+# ตัวขึ้นบรรทัดแบบอื่นที่ splitlines() รู้จัก (นอกจาก '\n' และ '\r\n')
+_OTHER_BREAKS = b"\r\x0b\x0c\x1c\x1d\x1e"
+
+# ช่องที่ Pawn ต้องยืนอยู่ถึงจะตี King ได้ (ด้านล่างทแยง 1 ช่อง)
+PAWN_SOURCES = ((1, -1), (1, 1))
+
+# บอร์ดใหญ่สุดที่รับ ถ้าไม่ได้ส่ง large=True
+MAX_SIZE = 8
+
+# วิธีตรวจที่เลือกได้: "scan" ยิง ray จากศัตรูทุกตัว, "reverse" ยิงจาก King ออกไป
+# "bitboard" ใช้ bit ops, "indexed" หาตัวที่ขวางใกล้ King ที่สุดด้วย binary search
+# บนแค่ 4 เส้นที่ผ่าน King (lineindex.py)
+# ค่า default "auto" เลือก "reverse" ถ้าบอร์ดไม่เกิน MAX_SIZE ไม่งั้นใช้ "indexed"
+# (วัดแล้ว "reverse" เร็วสุดบนบอร์ด 8x8 แม้แต่เทียบกับ "bitboard")
+# บอร์ดเกิน MAX_SIZE ทุก engine ใช้ "indexed" แทน: "scan" กับ "reverse" ต้องใช้
+# ตาราง ray ขนาด O(n^3) ที่ cache ไว้ตลอด (64x64 ราว 68 MiB, 128x128 ราว 540 MiB)
+# ส่วน "indexed" ไม่มีตาราง และเร็วพอ ๆ กับ "reverse" ตั้งแต่ 32x32 ขึ้นไป
+ENGINES = ("scan", "reverse", "bitboard", "indexed")
+
+# เก็บตาราง ray ที่คำนวณแล้ว แยกตามขนาดบอร์ด n
+_RAY_TABLES = {}
+
+
+def _build_rays(n, directions, step_once):
+    per_square = []
+    for r in range(n):
+        for c in range(n):
+            rays = []
+            for dr, dc in directions:
+                ray = []
+                cur_r, cur_c = r + dr, c + dc
+                while 0 <= cur_r < n and 0 <= cur_c < n:
+                    ray.append(cur_r * n + cur_c)
+                    if step_once:
+                        break
+                    cur_r += dr
+                    cur_c += dc
+                if ray:
+                    rays.append(tuple(ray))
+            per_square.append(tuple(rays))
+    return tuple(per_square)
+
+
+def ray_table(n):
+    """คืนตาราง ray ของบอร์ด n x n: table[piece][square] = tuple ของ ray
+    แต่ละ ray คือ tuple ของช่อง (r * n + c) เรียงจากใกล้ไปไกล
+    table['p'][square] คือช่องที่ Pawn ต้องอยู่เพื่อตีช่อง square"""
+    table = _RAY_TABLES.get(n)
+    if table is not None:
+        return table
+    table = {}
+    for piece, directions in DIRECTIONS.items():
+        table[piece] = _build_rays(n, directions, piece == 'P')
+    table['p'] = _build_rays(n, PAWN_SOURCES, True)
+    _RAY_TABLES[n] = table
+    return table
+
+
+def _scan_enemies(cells, n, king_pos, enemy_pieces):
+    """ยิง ray ออกจากศัตรูทีละตัว คืนช่องของตัวแรกที่ชน King หรือ None"""
+    rays = ray_table(n)
+    for piece, square in enemy_pieces:
+        for ray in rays[piece][square]:
+            for cur in ray:
+                # ถ้าเจอ King
+                if cur == king_pos:
+                    return square
+                if cells[cur] != EMPTY:
+                    break
+    return None
+
+
+def _scan_from_king(cells, n, king_pos):
+    """ยิง ray ออกจาก King ครั้งเดียว ดูตัวแรกที่ชนในแต่ละทิศ
+    คืนช่องของตัวที่ตี King หรือ None"""
+    rays = ray_table(n)
+    for probe in rays['p'][king_pos]:
+        if cells[probe[0]] == PAWN:
+            return probe[0]
+    for attackers, king_rays in ((b"RQ", rays['R'][king_pos]),
+                                 (b"BQ", rays['B'][king_pos])):
+        for ray in king_rays:
+            for cur in ray:
+                if cells[cur] != EMPTY:
+                    if cells[cur] in attackers:
+                        return cur
+                    break
+    return None
+
+
+def _scan_enemies_counted(cells, n, king_pos, enemy_pieces, stats):
+    """_scan_enemies ที่นับ ray / ช่อง / การชนตัวขวาง ลง stats
+    แยกเป็นอีกฟังก์ชันเพื่อให้ตัวปกติไม่ต้องเช็ค stats ใน loop"""
+    rays = ray_table(n)
+    for piece, square in enemy_pieces:
+        for ray in rays[piece][square]:
+            stats.rays += 1
+            for cur in ray:
+                stats.squares += 1
+                if cur == king_pos:
+                    return square
+                if cells[cur] != EMPTY:
+                    stats.blocked += 1
+                    break
+    return None
+
+
+def _scan_from_king_counted(cells, n, king_pos, stats):
+    """_scan_from_king ที่นับลง stats (ช่องที่ดู Pawn นับเป็น ray ละ 1 ช่อง)"""
+    rays = ray_table(n)
+    for probe in rays['p'][king_pos]:
+        stats.rays += 1
+        stats.squares += 1
+        if cells[probe[0]] == PAWN:
+            return probe[0]
+    for attackers, king_rays in ((b"RQ", rays['R'][king_pos]),
+                                 (b"BQ", rays['B'][king_pos])):
+        for ray in king_rays:
+            stats.rays += 1
+            for cur in ray:
+                stats.squares += 1
+                if cells[cur] != EMPTY:
+                    if cells[cur] in attackers:
+                        return cur
+                    stats.blocked += 1
+                    break
+    return None
+
+
+def _scan_indexed(cells, n, king_pos, enemy_pieces):
+    """หาตัวที่ใกล้ King ที่สุดในแต่ละทิศจาก index ของ 4 เส้นที่ผ่าน King
+    คืนช่องของตัวที่ตี King หรือ None"""
+    kr, kc = divmod(king_pos, n)
+    for dr, dc in PAWN_SOURCES:
+        r, c = kr + dr, kc + dc
+        if 0 <= r < n and 0 <= c < n and cells[r * n + c] == PAWN:
+            return r * n + c
+    index = LineIndex.around(cells, n, king_pos)
+    for attackers, directions in ((b"RQ", DIRECTIONS['R']), (b"BQ", DIRECTIONS['B'])):
+        for direction in directions:
+            square = index.nearest(king_pos, direction)
+            if square is not None and cells[square] in attackers:
+                return square
+    return None
+
+
+def _scan_indexed_counted(cells, n, king_pos, enemy_pieces, stats):
+    """_scan_indexed ที่นับลง stats: ช่องที่ดู Pawn และการหา nearest() แต่ละทิศ
+    นับเป็น ray ละครั้ง (ไม่ได้เดินทีละช่อง จึงนับ squares เฉพาะช่องที่ดู Pawn)"""
+    kr, kc = divmod(king_pos, n)
+    for dr, dc in PAWN_SOURCES:
+        r, c = kr + dr, kc + dc
+        if 0 <= r < n and 0 <= c < n:
+            stats.rays += 1
+            stats.squares += 1
+            if cells[r * n + c] == PAWN:
+                return r * n + c
+    index = LineIndex.around(cells, n, king_pos)
+    for attackers, directions in ((b"RQ", DIRECTIONS['R']), (b"BQ", DIRECTIONS['B'])):
+        for direction in directions:
+            stats.rays += 1
+            square = index.nearest(king_pos, direction)
+            if square is not None:
+                if cells[square] in attackers:
+                    return square
+                stats.blocked += 1
+    return None
+
+
+# รหัส error -> ข้อความที่ print
+ERRORS = {
+    "not_string": "Board is not a string",
+    "not_square": "Board is not square",
+    "two_kings": "Can only have one King",
+    "no_king": "King is missing",
+    "too_big": "Board is too big",
+}
+
+
+class Result:
+    """ผลการตรวจหนึ่งบอร์ด
+    verdict: "Success", "Fail" หรือ "Error"
+    error: รหัสใน ERRORS (เฉพาะตอน verdict เป็น "Error")
+    piece, square: ตัวที่ตี King และตำแหน่ง (r, c) (เฉพาะตอน "Success")
+    ถ้ามีหลายตัวตีพร้อมกัน ตัวที่รายงานขึ้นกับ engine"""
+
+    __slots__ = ("verdict", "error", "piece", "square")
+
+    def __init__(self, verdict, error=None, piece=None, square=None):
+        self.verdict = verdict
+        self.error = error
+        self.piece = piece
+        self.square = square
+
+    @property
+    def message(self):
+        """ข้อความแบบเดียวกับที่ checkmate() print"""
+        if self.error is not None:
+            return "Error: " + ERRORS[self.error]
+        return self.verdict
+
+    def __eq__(self, other):
+        if not isinstance(other, Result):
+            return NotImplemented
+        return (self.verdict, self.error, self.piece, self.square) == \
+            (other.verdict, other.error, other.piece, other.square)
+
+    def __repr__(self):
+        return "Result(%r, error=%r, piece=%r, square=%r)" % (
+            self.verdict, self.error, self.piece, self.square)
+
+
+# ตั้ง CHECKMATE_DEBUG=1 เพื่อให้ print ข้อมูล debug ทุกครั้งที่ไม่ได้ส่ง verbose มา
+DEBUG_ENV = "CHECKMATE_DEBUG"
+
+
+class Stats:
+    """ตัวนับสำหรับดูว่าเวลาหมดไปกับส่วนไหน ส่ง stats=Stats() ให้
+    evaluate() / checkmate_many() (ไม่ส่ง = ไม่นับอะไรเลย)
+    boards: จำนวนบอร์ดที่ตรวจ, screened: บอร์ดที่ตอบ Fail ได้ก่อนยิง ray
+    rays, squares, blocked: ray ที่ยิง ช่องที่เดินผ่าน และครั้งที่ชนตัวขวาง
+    (ทุก engine นับ rays กับ blocked ได้ "bitboard" นับทิศที่ดู และ "indexed"
+    นับการหา nearest() แต่ละทิศเป็น ray ส่วน squares นับครบเฉพาะ engine
+    ที่เดินทีละช่อง คือ "scan" กับ "reverse" ซึ่ง "auto" ใช้กับบอร์ดไม่เกิน MAX_SIZE)
+    parse_ns, scan_ns: เวลาที่ใช้ parse และตรวจด้วย engine (nanosecond)
+    รวมผลจากหลาย process ได้ด้วย merge() (Stats ส่งข้าม process ได้)"""
+
+    __slots__ = ("boards", "screened", "rays", "squares", "blocked",
+                 "parse_ns", "scan_ns")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def merge(self, other):
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return "Stats(%s)" % ", ".join(
+            "%s=%d" % (name, getattr(self, name)) for name in self.__slots__)
+
+
+def _debug_stream(verbose, log):
+    """คืน stream ที่จะเขียนข้อมูล debug หรือ None ถ้าปิดอยู่"""
+    if verbose is None:
+        verbose = os.environ.get(DEBUG_ENV, "") not in ("", "0")
+    if not verbose:
+        return None
+    if log is None:
+        return sys.stdout
+    return log
+
+
+def _check_engine(engine):
+    if engine != "auto" and engine not in ENGINES:
+        raise ValueError("unknown engine: %r" % (engine,))
+
+
+def _may_be_attacked(cells, n, king_pos):
+    """เช็คแบบถูก ๆ ก่อนยิง ray: มี Rook/Queen ในแถวหรือคอลัมน์ของ King
+    มี Bishop/Queen ในเส้นทแยงของ King หรือมี Pawn ทแยงล่างติด King ไหม
+    ถ้าไม่มีเลย King ไม่มีทางถูกตี (คืน False) ใช้ slice ของบอร์ดแบบแบน"""
+    if n == 1:
+        return False
+    kr, kc = divmod(king_pos, n)
+    if kr + 1 < n and ((kc > 0 and cells[king_pos + n - 1] == PAWN) or
+                       (kc + 1 < n and cells[king_pos + n + 1] == PAWN)):
+        return True
+    row = cells[kr * n:(kr + 1) * n]
+    column = cells[kc::n]
+    # เส้นทแยง '\' (r - c คงที่) และ '/' (r + c คงที่)
+    back = min(kr, kc)
+    length = n - abs(kr - kc)
+    start = king_pos - back * (n + 1)
+    diagonal = cells[start:start + (length - 1) * (n + 1) + 1:n + 1]
+    back = min(kr, n - 1 - kc)
+    length = n - abs(kr + kc - (n - 1))
+    start = king_pos - back * (n - 1)
+    anti_diagonal = cells[start:start + (length - 1) * (n - 1) + 1:n - 1]
+    return bool((row + column).translate(None, b".KPB") or
+                (diagonal + anti_diagonal).translate(None, b".KPR"))
+
+
+def parse_into(board, cells, enemy_pieces, log=None, large=False, screen=False):
+    """parse บอร์ดข้อความลงใน cells (bytearray) และ enemy_pieces (list)
+    ที่ส่งมา (ล้างของเดิมก่อน) คืน (n, ช่องของ King, รหัส error หรือ None)
+    บอร์ดเกิน MAX_SIZE เป็น error เว้นแต่ส่ง large=True
+
+    บอร์ด ASCII ที่เป็นสี่เหลี่ยมจัตุรัส (กรณีปกติ) ใช้ bytes.translate รอบเดียว
+    ที่ทั้งตัดตัวขึ้นบรรทัด แปลงตัวอื่นเป็น '.' และได้บอร์ดแบบแบนเลย
+    ไม่ต้องสร้าง list ของแต่ละแถว กรณีอื่นใช้ _parse_rows ที่ให้ error แบบเดิม
+
+    screen=True: ถ้าไม่มีศัตรูตัวไหนอยู่ในแนวที่ตี King ได้เลย (_may_be_attacked)
+    จะไม่เก็บ enemy_pieces (ปล่อยว่าง) เพราะผลต้องเป็น Fail อยู่แล้ว"""
     if not isinstance(board, str):
-        return
+        return 0, None, "not_string"
+    if log is not None:
+        print("board:", board.splitlines(), file=log)
+    if not board or not board.isascii():
+        return _parse_rows(board, cells, enemy_pieces, large)
+    data = board.encode("ascii")
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n")
+    if data.endswith(b"\n"):
+        data = data[:-1]
+    n = data.find(b"\n")
+    if n == -1:
+        n = len(data)
+    # สี่เหลี่ยมจัตุรัส: n แถว แถวละ n ตัว คั่นด้วย '\n' ตรงตำแหน่ง n, 2n+1, ...
+    if (n == 0 or len(data) != n * n + n - 1 or data.count(b"\n") != n - 1
+            or data[n::n + 1] != b"\n" * (n - 1)
+            or len(data.translate(None, _OTHER_BREAKS)) != len(data)):
+        return _parse_rows(board, cells, enemy_pieces, large)
+    if n > MAX_SIZE and not large:
+        return n, None, "too_big"
+    flat = data.translate(_NORMALIZE, b"\n")
+    cells[:] = flat
+    king_pos, error = _collect(flat, n, enemy_pieces, screen)
+    return n, king_pos, error
+
+
+def _collect(flat, n, enemy_pieces, screen):
+    """หา King และเก็บศัตรูจากบอร์ดแบบแบนที่ normalize แล้ว (bytes)
+    คืน (ช่องของ King, รหัส error หรือ None) screen ใช้แบบเดียวกับ parse_into"""
+    kings = flat.count(b"K")
+    if kings > 1:
+        return None, "two_kings"
+    if kings == 0:
+        return None, "no_king"
+    enemy_pieces.clear()
+    king_pos = flat.find(b"K")
+    if screen and not _may_be_attacked(flat, n, king_pos):
+        return king_pos, None
+    mask = flat.translate(_ENEMY_MASK)
+    enemy_pieces.extend(zip(compress(flat.decode("ascii"), mask),
+                            compress(range(n * n), mask)))
+    return king_pos, None
+
+
+def _parse_rows(board, cells, enemy_pieces, large):
+    """parse ทีละแถวแบบเดิม ใช้กับบอร์ดที่ไม่ใช่สี่เหลี่ยมจัตุรัสหรือมีตัวที่ไม่ใช่ ASCII"""
     list_board = board.splitlines()
-    print(list_board)
-    grid_board = []
-    for line in list_board:
-        grid_board.append(list(line)) # เปลี่ยน "R..." เป็น ['R', '.', '.', '.']
-    # print(grid_board)
-        
+    n = len(list_board)
+    if n > MAX_SIZE and not large:
+        return n, None, "too_big"
+    cells.clear() # บอร์ดแบบแบน (bytearray) ช่อง (r, c) อยู่ที่ index r * n + c
+    enemy_pieces.clear() #ตำแหน่งของศัตรู มีหลายตำแหน่ง
     king_pos = None #ตำแหน่งของking 
-    enemy_pieces = [] #ตำแหน่งของศัตรู มีหลายตำแหน่ง
-    
-    for r,row in enumerate(grid_board):
-        if len(row) != len(grid_board):
-            print("Error: Board is not square")
-            return
-        for c,char in enumerate(row):
+
+    for r, line in enumerate(list_board):
+        if len(line) != n:
+            return n, None, "not_square"
+        for c, char in enumerate(line):
             if char not in "PBRQK":
-                grid_board[r][c] = '.' #ถ้าไม่ใช่ตัวที่กำหนดให้เป็นจุด
+                cells.append(EMPTY) #ถ้าไม่ใช่ตัวที่กำหนดให้เป็นจุด
             else:
+                cells.append(ord(char))
                 if char == 'K':
                     if king_pos is not None:
-                        print("Error: Can only have one King")
-                        return
-                    king_pos = (r,c)
+                        return n, None, "two_kings"
+                    king_pos = r * n + c
                 else:
                     #เก็บทั้งชนิดและพิกัดไว้ใน list เดียวกัน
-                    enemy_pieces.append((char, r, c))
+                    enemy_pieces.append((char, r * n + c))
     if king_pos is None:
-        print("Error: King is missing")
-        return         
-
-    for piece, start_r, start_c in enemy_pieces:
-        # กำหนดทิศทางการเดินของแต่ละตัว
-        directions = []
-        if piece == 'P':
-            directions = [(-1, -1), (-1, 1)]
-        elif piece == 'R': 
-            directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        elif piece == 'B':
-            directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        elif piece == 'Q':
-            directions = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
-        for dr, dc in directions:
-            cur_r, cur_c = start_r + dr, start_c + dc
-            while 0 <= cur_r < len(grid_board) and 0 <= cur_c < len(grid_board):
-                # ถ้าเจอ King 
-                if (cur_r, cur_c) == king_pos:
-                    print("Success")
-                    return
-                if grid_board[cur_r][cur_c] != '.':
-                    break
-                if piece == 'P':
-                    break
-                # ไปช่องต่อไป
-                cur_r += dr
-                cur_c += dc
-    print("Fail")
-    # print(grid_board)
-    # print(king_pos)
-    # print(enemy_pieces)
\ No newline at end of file
+        return n, None, "no_king"
+    return n, king_pos, None
+
+
+def _evaluate(board, engine, cells, enemy_pieces, log=None, large=False, stats=None):
+    """ตรวจบอร์ดหนึ่งกระดาน คืน Result (ไม่ print)
+    cells และ enemy_pieces ใช้ซ้ำได้ระหว่างบอร์ด
+    ถ้า log ไม่ใช่ None จะเขียนข้อมูล debug ลงไป (และไม่ข้ามการเก็บศัตรู)"""
+    if stats is not None:
+        return _evaluate_counted(board, engine, cells, enemy_pieces, log, large, stats)
+    n, king_pos, error = parse_into(board, cells, enemy_pieces, log, large,
+                                    screen=log is None)
+    if error is not None:
+        return Result("Error", error)
+    if log is None and not enemy_pieces:
+        return Result("Fail")  # ไม่มีศัตรู หรือไม่มีตัวไหนอยู่ในแนวของ King
+    return _judge(cells, n, king_pos, enemy_pieces, engine, log)
+
+
+def _evaluate_counted(board, engine, cells, enemy_pieces, log, large, stats):
+    """_evaluate ที่จับเวลาแต่ละช่วงและนับลง stats"""
+    stats.boards += 1
+    start = time.perf_counter_ns()
+    n, king_pos, error = parse_into(board, cells, enemy_pieces, log, large,
+                                    screen=log is None)
+    parsed = time.perf_counter_ns()
+    stats.parse_ns += parsed - start
+    if error is not None:
+        return Result("Error", error)
+    if log is None and not enemy_pieces:
+        stats.screened += 1
+        return Result("Fail")
+    result = _judge(cells, n, king_pos, enemy_pieces, engine, log, stats)
+    stats.scan_ns += time.perf_counter_ns() - parsed
+    return result
+
+
+def _judge(cells, n, king_pos, enemy_pieces, engine, log=None, stats=None):
+    """ตรวจบอร์ดที่ parse แล้ว ว่ามีตัวไหนตี King"""
+    if log is not None:
+        print("king:", divmod(king_pos, n), file=log)
+        print("enemies:", [(piece,) + divmod(square, n)
+                           for piece, square in enemy_pieces], file=log)
+
+    if engine == "auto" or n > MAX_SIZE:
+        engine = "reverse" if n <= MAX_SIZE else "indexed"
+    if engine == "bitboard" and n <= bitboard.MAX_SIZE:
+        r, c = divmod(king_pos, n)
+        boards = bitboard.from_cells(cells, n)
+        if stats is None:
+            attacker = bitboard.attacker_of(r * 8 + c, *boards)
+        else:
+            attacker = bitboard.attacker_of_counted(r * 8 + c, *boards, stats)
+        if attacker is not None:
+            r, c = divmod(attacker, 8)
+            attacker = r * n + c
+    elif engine in ("bitboard", "indexed"):
+        if stats is None:
+            attacker = _scan_indexed(cells, n, king_pos, enemy_pieces)
+        else:
+            attacker = _scan_indexed_counted(cells, n, king_pos, enemy_pieces, stats)
+    elif engine == "reverse":
+        if stats is None:
+            attacker = _scan_from_king(cells, n, king_pos)
+        else:
+            attacker = _scan_from_king_counted(cells, n, king_pos, stats)
+    elif stats is None:
+        attacker = _scan_enemies(cells, n, king_pos, enemy_pieces)
+    else:
+        attacker = _scan_enemies_counted(cells, n, king_pos, enemy_pieces, stats)
+    if attacker is None:
+        return Result("Fail")
+    return Result("Success", piece=chr(cells[attacker]), square=divmod(attacker, n))
+
+
+def _evaluate_cached(board, engine, cells, enemy_pieces, log, cache, large,
+                     stats=None):
+    """เหมือน _evaluate แต่ถามจาก cache (cache.VerdictCache) ก่อน"""
+    if cache is None or not isinstance(board, str):
+        return _evaluate(board, engine, cells, enemy_pieces, log, large, stats)
+    key = cache.key(board, large)
+    result = cache.get(key)
+    if result is None:
+        result = _evaluate(board, engine, cells, enemy_pieces, log, large, stats)
+        cache.put(key, result)
+    return result
+
+
+def evaluate(board, engine="auto", verbose=None, log=None, cache=None, large=False,
+             stats=None):
+    """ตรวจบอร์ดแบบไม่ print คืน Result
+    verbose=True เขียนข้อมูล debug (บอร์ด, King, ศัตรู) ลง log (default stdout)
+    verbose=None ดูจาก environment variable CHECKMATE_DEBUG
+    cache เป็น cache.VerdictCache ถ้าอยากให้บอร์ดซ้ำไม่ต้องตรวจใหม่
+    large=True รับบอร์ดใหญ่กว่า MAX_SIZE
+    stats เป็น Stats ถ้าอยากนับว่าเวลาหมดไปกับส่วนไหน"""
+    _check_engine(engine)
+    log = _debug_stream(verbose, log)
+    return _evaluate_cached(board, engine, bytearray(), [], log, cache, large, stats)
+
+
+def evaluate_cells(cells, n, engine="auto", verbose=None, log=None, large=False):
+    """ตรวจบอร์ด n x n ที่เก็บเป็น bytes แบบแบนอยู่แล้ว (ไม่ต้อง parse ข้อความ)
+    cells เป็น bytes-like อะไรก็ได้ เช่น memoryview ของ mmap ช่องละ 1 byte
+    byte ที่ไม่ใช่ PBRQK ถือเป็นช่องว่างเหมือน checkmate()
+    ถ้า cells ไม่ได้มี n * n ช่องพอดีจะได้ ValueError"""
+    _check_engine(engine)
+    return _evaluate_flat(cells, n, engine, _debug_stream(verbose, log), large)
+
+
+def evaluate_cells_many(records, engine="auto", verbose=None, log=None, large=False):
+    """evaluate_cells ของหลายบอร์ด records เป็น iterable ของ (n, cells)
+    (เช่นจาก binformat.read_records) yield Result ทีละบอร์ด"""
+    _check_engine(engine)
+    log = _debug_stream(verbose, log)
+    for n, cells in records:
+        yield _evaluate_flat(cells, n, engine, log, large)
+
+
+def _evaluate_flat(cells, n, engine, log, large):
+    if len(cells) != n * n:
+        raise ValueError("cells must hold %d squares, got %d" % (n * n, len(cells)))
+    if n > MAX_SIZE and not large:
+        return Result("Error", "too_big")
+    # copy ออกจาก memoryview แล้ว normalize (ไฟล์ที่ไม่ได้เขียนด้วย
+    # binformat.write_boards อาจมีตัวอื่นปน จึงข้าม translate ไม่ได้)
+    flat = bytes(cells).translate(_NORMALIZE)
+    enemy_pieces = []
+    king_pos, error = _collect(flat, n, enemy_pieces, log is None)
+    if error is not None:
+        return Result("Error", error)
+    if log is None and not enemy_pieces:
+        return Result("Fail")
+    return _judge(flat, n, king_pos, enemy_pieces, engine, log)
+
+
+def checkmate(board, engine="auto", verbose=None, log=None, cache=None, large=False):
+    _check_engine(engine)
+    if not isinstance(board, str):
+        return
+    log = _debug_stream(verbose, log)
+    print(_evaluate_cached(board, engine, bytearray(), [], log, cache, large).message)
+
+
+def checkmate_many(boards, engine="auto", verbose=None, log=None, cache=None,
+                   large=False, stats=None):
+    """ตรวจหลายบอร์ดจาก iterable ใดก็ได้ (generator ก็ได้)
+    yield Result ทีละบอร์ดแบบ lazy ใช้ list ชุดเดียวกันทุกบอร์ด
+    ส่ง log เป็น io.StringIO เพื่อเก็บข้อมูล debug ไว้แทน stdout"""
+    _check_engine(engine)
+    log = _debug_stream(verbose, log)
+    cells = bytearray()
+    enemy_pieces = []
+    for board in boards:
+        yield _evaluate_cached(board, engine, cells, enemy_pieces, log, cache,
+                               large, stats)
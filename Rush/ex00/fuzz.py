@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# differential fuzzing: ป้อนบอร์ดสุ่มและบอร์ดที่ถูกดัดแปลง (รวมแบบเพี้ยน ๆ จาก test_evil.py
+# เช่น ไม่ใช่ string, CRLF, tab, emoji, แถวยาวไม่เท่ากัน) ให้ทุกวิธีตรวจ แล้วดูว่าตอบตรงกันไหม
+# เจอที่ไม่ตรงกันจะย่อบอร์ดให้เล็กที่สุดที่ยังไม่ตรงกันอยู่ ไว้ทำเป็น test
+# รันได้ offline และจำกัดเวลาได้:  python fuzz.py --budget 3600 -j 4 -o failures.json
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from checkmate import ENGINES, checkmate, evaluate
+from generator import random_board
+from position import Position
+import vectorized
+
+
+def _printed(board):
+    """ข้อความที่ checkmate() print จริง ๆ (ไม่ใช่ string จะไม่ print อะไร จึงข้ามไป)"""
+    if not isinstance(board, str):
+        return None
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        checkmate(board)
+    return out.getvalue().rstrip("\n")
+
+
+def _position(board):
+    try:
+        return Position.from_board(board).result().message
+    except ValueError as error:
+        return "Error: %s" % error
+
+
+def _engine(engine):
+    return lambda board: evaluate(board, engine=engine).message
+
+
+# ชื่อ -> ฟังก์ชันที่รับบอร์ดแล้วคืนข้อความแบบที่ checkmate() print (None = ข้าม)
+PATHS = {"checkmate": _printed, "position": _position}
+for _name in ENGINES:
+    PATHS[_name] = _engine(_name)
+if vectorized.np is not None:
+    PATHS["vectorized"] = lambda board: vectorized.evaluate_many([board])[0]
+
+# input ที่ไม่ใช่ string
+NOT_STRINGS = (None, 42, 3.5, True, [], {}, ["K."], b"K.\n..")
+# ตัวอักษรแปลก ๆ ที่เอาไปแทรก
+ODD_CHARS = ("\t", " ", "\r", "\x0b", "\x1c", " ", "é", "♔", "😀", "k", "q", "0")
+
+
+def mutate(rng, board):
+    """ดัดแปลงบอร์ดหนึ่งแบบแบบสุ่ม อาจได้ของที่ไม่ใช่ string ด้วย"""
+    kind = rng.randrange(12)
+    if kind == 0:
+        return rng.choice(NOT_STRINGS)
+    if kind == 1:
+        return board.replace("\n", "\r\n")
+    if kind == 2:
+        return rng.choice(("\n", "\r\n", "")) + board + rng.choice(("\n", "\n\n", " "))
+    if not board:
+        return board
+    i = rng.randrange(len(board))
+    if kind == 3:
+        return board[:i] + rng.choice(ODD_CHARS) + board[i:]
+    if kind == 4:
+        return board[:i] + rng.choice(ODD_CHARS) + board[i + 1:]
+    if kind == 5:
+        return board[:i] + board[i + 1:]                      # แถวสั้นไป
+    if kind == 6:
+        return board[:i] + rng.choice(".PBRQ") + board[i:]    # แถวยาวไป
+    if kind == 7:
+        return board.replace(".", "K", 1)                      # King สองตัว
+    if kind == 8:
+        return board.replace("K", ".")                         # ไม่มี King
+    if kind == 9:
+        return board.lower()
+    if kind == 10:
+        rows = board.split("\n")
+        rng.shuffle(rows)
+        return "\n".join(rows)
+    return board[:i] + rng.choice("PBRQK.") + board[i + 1:]
+
+
+def outcomes(board, paths=None):
+    """คำตอบของทุก path (path ที่ crash ได้ข้อความ "crash: ...")"""
+    found = {}
+    for name, path in (paths or PATHS).items():
+        try:
+            message = path(board)
+        except Exception as error:
+            message = "crash: %s: %s" % (type(error).__name__, error)
+        if message is not None:
+            found[name] = message
+    return found
+
+
+def disagrees(board, paths=None):
+    return len(set(outcomes(board, paths).values())) > 1
+
+
+def minimize(board, paths=None):
+    """ย่อบอร์ด (string) ที่ path ตอบไม่ตรงกัน ให้เหลือเล็กที่สุดที่ยังไม่ตรงกัน
+    ลองตัดทีละแถว ตัดทีละตัว และเปลี่ยนตัวหมากเป็น '.' จนย่อต่อไม่ได้"""
+    if not isinstance(board, str):
+        return board
+    changed = True
+    while changed:
+        changed = False
+        rows = board.split("\n")
+        for i in range(len(rows)):
+            candidate = "\n".join(rows[:i] + rows[i + 1:])
+            if disagrees(candidate, paths):
+                board, changed = candidate, True
+                break
+        if changed:
+            continue
+        for i in range(len(board)):
+            for candidate in (board[:i] + board[i + 1:], board[:i] + "." + board[i + 1:]):
+                if candidate != board and disagrees(candidate, paths):
+                    board, changed = candidate, True
+                    break
+            if changed:
+                break
+    return board
+
+
+def fuzz(seed, budget, max_failures=20):
+    """fuzz ไปเรื่อย ๆ จนครบ budget วินาที (หรือเจอครบ max_failures)
+    คืน (จำนวนบอร์ดที่ลอง, list ของ failure)"""
+    rng = random.Random(seed)
+    deadline = time.monotonic() + budget
+    tried = 0
+    failures = []
+    seen = set()
+    while time.monotonic() < deadline and len(failures) < max_failures:
+        board = random_board(rng, rng.randint(1, 10), rng.random() * 0.6,
+                             junk=rng.choice((0.0, 0.1)))
+        for _ in range(rng.randrange(3)):
+            if isinstance(board, str):
+                board = mutate(rng, board)
+        tried += 1
+        if not disagrees(board):
+            continue
+        smallest = minimize(board)
+        if repr(smallest) in seen:
+            continue
+        seen.add(repr(smallest))
+        failures.append({"board": repr(board), "minimized": repr(smallest),
+                         "outcomes": outcomes(smallest)})
+    return tried, failures
+
+
+def run(budget, workers=None, seed=0):
+    """fuzz ขนานกัน workers process (default = จำนวน CPU) คืน dict ผลรวม"""
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        jobs = [pool.submit(fuzz, seed + i, budget) for i in range(workers)]
+        results = [job.result() for job in jobs]
+    failures = []
+    seen = set()
+    for _, found in results:
+        for failure in found:
+            if failure["minimized"] not in seen:
+                seen.add(failure["minimized"])
+                failures.append(failure)
+    return {
+        "seed": seed,
+        "workers": workers,
+        "budget": budget,
+        "paths": sorted(PATHS),
+        "tried": sum(tried for tried, _ in results),
+        "failures": failures,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="differential fuzzing ของทุก engine")
+    parser.add_argument("--budget", type=float, default=60, help="เวลาต่อ worker (วินาที)")
+    parser.add_argument("-j", "--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="เขียน JSON ลงไฟล์แทน stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.budget, args.workers, args.seed)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
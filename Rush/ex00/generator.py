@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# สร้างบอร์ดสุ่มแบบกำหนด seed ในรูปแบบข้อความเดียวกับที่ checkmate() รับ
+# ใช้ทำ load สำหรับ benchmark / soak test (seed เดิมได้บอร์ดชุดเดิมทุกครั้ง)
+#   python generator.py --count 1000000 --size 8 --verdict attacked -o boards.txt
+#   python generator.py --count 10 --size 4-8 --rooks 2 --queens 1 --junk 0.1
+import argparse
+import random
+import sys
+
+from checkmate import evaluate
+
+ENEMIES = "PBRQ"
+JUNK = "xz#1 "
+
+# verdict ที่บังคับได้ -> verdict ของ evaluate()
+VERDICTS = {"attacked": "Success", "safe": "Fail"}
+
+
+def random_board(rng, n, density=0.15, junk=0.0, counts=None):
+    """บอร์ด n x n มี King 1 ตัว
+    counts: dict จำนวนศัตรูแต่ละชนิด เช่น {"R": 2, "Q": 1} (วางในช่องที่ไม่ซ้ำกัน)
+    ถ้าไม่ส่ง counts แต่ละช่องเป็นศัตรูด้วยความน่าจะเป็น density แทน
+    junk: ความน่าจะเป็นที่ช่องว่างจะเป็นตัวขยะ (checkmate ถือเป็นช่องว่าง)"""
+    size = n * n
+    if counts is None:
+        empty = max(0.0, 1.0 - density - junk)
+        weights = [empty] + [density / 4] * 4 + [junk / len(JUNK)] * len(JUNK)
+        cells = rng.choices("." + ENEMIES + JUNK, weights, k=size)
+        cells[rng.randrange(size)] = "K"
+    else:
+        pieces = "".join(piece * counts.get(piece, 0) for piece in ENEMIES)
+        if len(pieces) + 1 > size:
+            raise ValueError("%d pieces do not fit on a %dx%d board"
+                             % (len(pieces) + 1, n, n))
+        if junk:
+            cells = [rng.choice(JUNK) if rng.random() < junk else "." for _ in range(size)]
+        else:
+            cells = ["."] * size
+        squares = rng.sample(range(size), len(pieces) + 1)
+        cells[squares[0]] = "K"
+        for square, piece in zip(squares[1:], pieces):
+            cells[square] = piece
+    return "\n".join("".join(cells[r * n:(r + 1) * n]) for r in range(n))
+
+
+def board_with_verdict(rng, n, verdict, max_tries=10000, **options):
+    """สุ่มจนได้บอร์ดที่ King ถูกตี (verdict="attacked") หรือไม่ถูกตี ("safe")
+    options ส่งต่อให้ random_board ถ้าสุ่มครบ max_tries แล้วยังไม่ได้จะ ValueError"""
+    wanted = VERDICTS[verdict]
+    for _ in range(max_tries):
+        board = random_board(rng, n, **options)
+        if evaluate(board, large=True).verdict == wanted:
+            return board
+    raise ValueError("no %s %dx%d board after %d tries" % (verdict, n, n, max_tries))
+
+
+def generate(count, seed=0, size=8, verdict=None, **options):
+    """yield บอร์ดสุ่ม count กระดาน
+    size เป็นจำนวนเต็ม หรือ (เล็กสุด, ใหญ่สุด) ให้สุ่มขนาดในช่วงนั้น
+    verdict เป็น None, "attacked" หรือ "safe" ที่เหลือส่งต่อให้ random_board"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = size if isinstance(size, int) else rng.randint(*size)
+        if verdict is None:
+            yield random_board(rng, n, **options)
+        else:
+            yield board_with_verdict(rng, n, verdict, **options)
+
+
+def write_boards(out, boards):
+    """เขียนบอร์ดคั่นด้วยบรรทัดว่าง (อ่านกลับด้วย reader.read_boards ได้)
+    out เป็น path, '-' (stdout) หรือ file object คืนจำนวนบอร์ดที่เขียน"""
+    if out == "-":
+        return _write(sys.stdout, boards)
+    if isinstance(out, str):
+        with open(out, "w", buffering=1 << 20) as f:
+            return _write(f, boards)
+    return _write(out, boards)
+
+
+def _write(f, boards):
+    written = 0
+    for board in boards:
+        f.write(board)
+        f.write("\n\n")
+        written += 1
+    return written
+
+
+def _size(text):
+    low, _, high = text.partition("-")
+    if high:
+        return (int(low), int(high))
+    return int(low)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="สร้างบอร์ดสุ่มแบบกำหนด seed")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", type=_size, default=8,
+                        help="ขนาดบอร์ด เช่น 8 หรือช่วง 4-8")
+    parser.add_argument("--density", type=float, default=0.15,
+                        help="ความน่าจะเป็นที่ช่องจะมีศัตรู (ถ้าไม่กำหนดจำนวนแต่ละตัว)")
+    for piece, name in zip(ENEMIES, ("pawns", "bishops", "rooks", "queens")):
+        parser.add_argument("--" + name, type=int, dest=piece,
+                            help="จำนวน %s (กำหนดตัวไหนก็ตาม = ไม่ใช้ --density)" % piece)
+    parser.add_argument("--verdict", choices=sorted(VERDICTS))
+    parser.add_argument("--junk", type=float, default=0.0)
+    parser.add_argument("-o", "--output", default="-", help="ไฟล์ที่จะเขียน ('-' = stdout)")
+    args = parser.parse_args(argv)
+
+    counts = {piece: getattr(args, piece) for piece in ENEMIES
+              if getattr(args, piece) is not None}
+    options = {"junk": args.junk}
+    if counts:
+        options["counts"] = counts
+    else:
+        options["density"] = args.density
+    write_boards(args.output, generate(args.count, args.seed, args.size,
+                                       args.verdict, **options))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# index ของช่องที่มีตัวหมาก แยกตามแถว คอลัมน์ และเส้นทแยงทั้งสองแบบ
+# แต่ละเส้นเป็น list ที่เรียงแล้ว หาตัวที่ใกล้ที่สุดในทิศไหนก็ได้ด้วย bisect
+# ใช้แทนการเดินทีละช่องบนบอร์ดใหญ่ (ยาวหลายร้อยช่อง)
+from bisect import bisect_left, bisect_right
+from itertools import compress
+
+# ตาราง translate: ช่องที่มีตัวหมาก (PBRQK) เป็น 1 ที่เหลือเป็น 0
+_OCCUPIED = bytes(1 if b in b"PBRQK" else 0 for b in range(256))
+
+
+def _occupied(line):
+    """ตำแหน่ง (นับจาก 0) ของช่องที่มีตัวหมากใน line (bytes) เรียงจากน้อยไปมาก"""
+    return list(compress(range(len(line)), line.translate(_OCCUPIED)))
+
+
+class LineIndex:
+    """squares ต้องเรียงตามลำดับช่อง (r * n + c) จากน้อยไปมาก
+    เช่นลำดับที่ได้จากการ parse บอร์ดทีละแถว"""
+
+    def __init__(self, n, squares):
+        self.n = n
+        self.rows = {}   # r -> [c, ...]
+        self.cols = {}   # c -> [r, ...]
+        self.diags = {}  # r - c -> [r, ...]
+        self.antis = {}  # r + c -> [r, ...]
+        for square in squares:
+            r, c = divmod(square, n)
+            self.rows.setdefault(r, []).append(c)
+            self.cols.setdefault(c, []).append(r)
+            self.diags.setdefault(r - c, []).append(r)
+            self.antis.setdefault(r + c, []).append(r)
+
+    @classmethod
+    def around(cls, cells, n, square):
+        """สร้าง index เฉพาะ 4 เส้นที่ผ่าน square (แถว คอลัมน์ ทแยงทั้งสองแบบ)
+        จากบอร์ดแบบแบน (normalize แล้ว) โดยตัดเส้นออกมาด้วย slice
+        ใช้ถาม nearest() ได้เฉพาะจาก square เท่านั้น"""
+        index = cls(n, ())
+        r, c = divmod(square, n)
+        index.rows[r] = _occupied(cells[r * n:(r + 1) * n])
+        index.cols[c] = _occupied(cells[c::n])
+        # ทแยง r - c คงที่: เริ่มจากขอบบนหรือขอบซ้าย เดินทีละ n + 1
+        first = max(r - c, 0)
+        start = first * n + first - (r - c)
+        stop = start + (n - abs(r - c) - 1) * (n + 1) + 1
+        index.diags[r - c] = [first + i for i in _occupied(cells[start:stop:n + 1])]
+        # ทแยง r + c คงที่: เริ่มจากขอบบนหรือขอบขวา เดินทีละ n - 1
+        first = max(r + c - (n - 1), 0)
+        last = min(r + c, n - 1)
+        start = first * n + r + c - first
+        if n > 1:
+            line = cells[start:start + (last - first) * (n - 1) + 1:n - 1]
+        else:
+            line = cells[start:start + 1]
+        index.antis[r + c] = [first + i for i in _occupied(line)]
+        return index
+
+    def nearest(self, square, direction):
+        """ช่องที่มีตัวหมากที่ใกล้ square ที่สุดในทิศ direction (ไม่นับ square เอง)
+        หรือ None ถ้าไม่มี"""
+        n = self.n
+        dr, dc = direction
+        r, c = divmod(square, n)
+        if dr == 0:
+            line, key, sign = self.rows.get(r), c, dc
+        elif dc == 0:
+            line, key, sign = self.cols.get(c), r, dr
+        elif dr == dc:
+            line, key, sign = self.diags.get(r - c), r, dr
+        else:
+            line, key, sign = self.antis.get(r + c), r, dr
+        if not line:
+            return None
+        if sign > 0:
+            i = bisect_right(line, key)
+            if i == len(line):
+                return None
+            found = line[i]
+        else:
+            i = bisect_left(line, key)
+            if i == 0:
+                return None
+            found = line[i - 1]
+        if dr == 0:
+            return r * n + found
+        # เส้นอื่นเก็บเป็นแถว คำนวณคอลัมน์จากระยะที่เดินไป
+        return found * n + c + (found - r) * dr * dc
@@ -1,8 +1,106 @@
 #!/usr/bin/env python3
-from checkmate import checkmate
-def main():
-    board = 123456789
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from checkmate import checkmate, checkmate_many, ENGINES, Stats
+from reader import read_boards
+
+
+def _chunks(boards, size):
+    chunk = []
+    for board in boards:
+        chunk.append(board)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _check_chunk(chunk, engine, large, count):
+    """คืน (list ของข้อความผลลัพธ์, Stats หรือ None)"""
+    stats = Stats() if count else None
+    results = checkmate_many(chunk, engine=engine, large=large, stats=stats)
+    return [result.message for result in results], stats
+
+
+def _next_done(pending, ordered):
+    """เอา chunk ถัดไปออกจากคิว: ตัวหน้าสุด หรือตัวไหนก็ได้ที่เสร็จแล้ว"""
+    if ordered:
+        return pending.popleft()
+    wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+    item = next(item for item in pending if item[1].done())
+    pending.remove(item)
+    return item
+
+
+def _collect(start, future, stats):
+    messages, chunk_stats = future.result()
+    if stats is not None:
+        stats.merge(chunk_stats)
+    for i, message in enumerate(messages):
+        yield start + i, message
+
+
+def run_batch(boards, workers=None, chunk_size=256, ordered=True, engine="auto",
+              large=False, stats=None):
+    """ตรวจบอร์ดจำนวนมากด้วยหลาย process
+    yield (ลำดับบอร์ด, ข้อความผลลัพธ์) ถ้า ordered=False จะได้ตามลำดับที่เสร็จ
+    ส่งงานทีละ chunk และค้างไว้ไม่เกิน 2 chunk ต่อ worker เพื่อไม่ให้กิน memory
+    ถ้าส่ง stats (checkmate.Stats) มา จะรวมตัวนับจากทุก worker ไว้ในนั้น"""
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for number, chunk in enumerate(_chunks(boards, chunk_size)):
+            future = pool.submit(_check_chunk, chunk, engine, large,
+                                 stats is not None)
+            pending.append((number * chunk_size, future))
+            while len(pending) >= max_pending:
+                start, future = _next_done(pending, ordered)
+                yield from _collect(start, future, stats)
+        while pending:
+            start, future = _next_done(pending, ordered)
+            yield from _collect(start, future, stats)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ตรวจว่า King ถูกตีหรือไม่")
+    parser.add_argument("file", nargs="?",
+                        help="ไฟล์บอร์ด คั่นแต่ละบอร์ดด้วยบรรทัดว่าง ('-' = stdin)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="จำนวน process (default: จำนวน core)")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--unordered", action="store_true",
+                        help="print ตามลำดับที่เสร็จ นำหน้าด้วยลำดับบอร์ด")
+    parser.add_argument("--engine", choices=("auto",) + ENGINES, default="auto")
+    parser.add_argument("--large", action="store_true",
+                        help="รับบอร์ดใหญ่กว่า 8x8")
+    parser.add_argument("--stats", action="store_true",
+                        help="print ตัวนับของทุก worker รวมกันเป็น JSON ลง stderr")
+    args = parser.parse_args(argv)
+
+    if args.file is None:
+        board = 123456789
+
+        checkmate(board)
+        return
+
+    stats = Stats() if args.stats else None
+    results = run_batch(read_boards(args.file), args.workers, args.chunk_size,
+                        not args.unordered, args.engine, args.large, stats)
+    for index, message in results:
+        if args.unordered:
+            print(index, message)
+        else:
+            print(message)
+    if stats is not None:
+        print(json.dumps(stats.as_dict()), file=sys.stderr)
+
 
-    checkmate(board)
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# ตรวจรุกจนจริง ๆ: King ถูกตีอยู่และไม่มีทางหนี
+# ใช้แผนที่การตี (attackmap.py) อันเดียวต่อบอร์ด ไม่ต้องตรวจใหม่ทีละช่องที่ King จะเดินไป
+#
+# ฝั่งเรามีแค่ King ตัวเดียว (ตัวอื่นบนบอร์ดเป็นศัตรูหมด) ทางรอดจึงมีแค่ King เดิน
+# ซึ่งรวมการกินตัวที่รุกอยู่ด้วย ส่วนการเอาตัวมาบังไม่มีทางเกิดขึ้น เพราะไม่มีตัวอื่นให้บัง
+from attackmap import AttackMap
+from checkmate import Result, parse_into
+
+# ทิศที่ King เดินได้ทีละ 1 ช่อง
+KING_STEPS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def king_escapes(cells, n, king_pos, attacks):
+    """ช่อง (r, c) ที่ King เดินไปได้โดยไม่ถูกตี (รวมการกินตัวที่ไม่มีใครคุ้มกัน)
+    attacks ต้องสร้างด้วย transparent=king_pos เพื่อให้ถอยตามแนวที่ถูกตีไม่ได้"""
+    kr, kc = divmod(king_pos, n)
+    escapes = []
+    for dr, dc in KING_STEPS:
+        r, c = kr + dr, kc + dc
+        if 0 <= r < n and 0 <= c < n and not attacks.masks[r * n + c]:
+            escapes.append((r, c))
+    return escapes
+
+
+def judge_mate(cells, n, king_pos):
+    """ตรวจบอร์ดที่ parse แล้ว คืน Result ที่ verdict เป็น
+    "Checkmate" (ถูกตีและหนีไม่ได้), "Check" (ถูกตีแต่ยังหนีได้) หรือ "Fail"
+    piece, square คือตัวที่ตี King (ถ้าหลายตัวจะเป็นตัวแรกตามลำดับช่อง)"""
+    attacks = AttackMap.from_cells(cells, n, transparent=king_pos)
+    checkers = attacks.masks[king_pos]
+    if not checkers:
+        return Result("Fail")
+    piece, square = attacks.pieces[(checkers & -checkers).bit_length() - 1]
+    verdict = "Check" if king_escapes(cells, n, king_pos, attacks) else "Checkmate"
+    return Result(verdict, piece=piece, square=divmod(square, n))
+
+
+def evaluate_mate(board, large=False):
+    """เหมือน checkmate.evaluate() แต่ดูด้วยว่า King หนีได้ไหม
+    บอร์ดที่ผิดได้ Result แบบ "Error" เหมือนเดิม"""
+    cells = bytearray()
+    n, king_pos, error = parse_into(board, cells, [], large=large)
+    if error is not None:
+        return Result("Error", error)
+    return judge_mate(cells, n, king_pos)
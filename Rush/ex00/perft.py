@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# perft: นับจำนวน node ปลายทางของต้นไม้การเดินลึก depth ตา ใช้วัดความเร็ว
+# การสร้างตาเดิน และเป็นตัวเทียบความถูกต้อง (ทุกวิธีต้องนับได้เท่ากัน)
+#
+# กติกา: ฝั่ง King (ตัวเดียว) เดินก่อน สลับกับฝั่งศัตรู
+#   King เดิน 1 ช่องรอบตัว กินศัตรูได้ แต่ห้ามเดินไปช่องที่ถูกตี
+#   Rook/Bishop/Queen เลื่อนตาม ray จนชนตัวอื่น (ไม่กินกันเอง และไม่กิน King
+#   เพราะ King เดินถูกกติกาแล้วจะไม่ถูกตีตอนศัตรูเดิน)
+#   Pawn เดินขึ้น 1 ช่องถ้าว่าง (ทิศเดียวกับที่มันตี) ถึงแถวบนสุดแล้วเดินต่อไม่ได้
+#     ไม่มีการเลื่อนขั้น
+# ตาที่ไม่มีทางเดินเลย (เช่นโดนรุกจน) นับเป็น 0 node แบบ perft ทั่วไป
+#
+# "path" คือวิธีเช็คว่า King เดินไปช่องไหนได้:
+#   "map"  ใช้ AttackMap อันเดียวต่อตา (mate.king_escapes)
+#   engine ใน ENGINES  ลองเดินแล้วเรียก evaluate_cells ทีละช่อง
+# รันเอง:  python perft.py board.txt --depth 4 --path map --path reverse
+import argparse
+import json
+import time
+
+from attackmap import AttackMap
+from checkmate import EMPTY, KING, ENGINES, ERRORS, evaluate_cells, parse_into, ray_table
+from mate import KING_STEPS, king_escapes
+from reader import read_boards
+
+PATHS = ("map",) + ENGINES
+
+
+def king_moves(cells, n, king, path="map"):
+    """ช่อง (index แบบแบน) ที่ King เดินไปได้ตามกติกา"""
+    if path == "map":
+        attacks = AttackMap.from_cells(cells, n, transparent=king)
+        return [r * n + c for r, c in king_escapes(cells, n, king, attacks)]
+    kr, kc = divmod(king, n)
+    moves = []
+    for dr, dc in KING_STEPS:
+        r, c = kr + dr, kc + dc
+        if not (0 <= r < n and 0 <= c < n):
+            continue
+        to = r * n + c
+        captured = cells[to]
+        cells[king] = EMPTY
+        cells[to] = KING
+        if evaluate_cells(cells, n, path, verbose=False, large=True).verdict == "Fail":
+            moves.append(to)
+        cells[to] = captured
+        cells[king] = KING
+    return moves
+
+
+def enemy_moves(cells, n):
+    """list ของ (จากช่อง, ไปช่อง) ของศัตรูทุกตัว"""
+    rays = ray_table(n)
+    moves = []
+    for square in range(n * n):
+        code = cells[square]
+        if code == EMPTY or code == KING:
+            continue
+        if code == ord('P'):
+            if square >= n and cells[square - n] == EMPTY:
+                moves.append((square, square - n))
+            continue
+        for ray in rays[chr(code)][square]:
+            for cur in ray:
+                if cells[cur] != EMPTY:
+                    break
+                moves.append((square, cur))
+    return moves
+
+
+def _perft(cells, n, depth, path, king_to_move):
+    if king_to_move:
+        king = cells.find(KING)
+        moves = king_moves(cells, n, king, path)
+        if depth == 1:
+            return len(moves)
+        nodes = 0
+        for to in moves:
+            captured = cells[to]
+            cells[king] = EMPTY
+            cells[to] = KING
+            nodes += _perft(cells, n, depth - 1, path, False)
+            cells[to] = captured
+            cells[king] = KING
+        return nodes
+    moves = enemy_moves(cells, n)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for start, end in moves:
+        cells[end] = cells[start]
+        cells[start] = EMPTY
+        nodes += _perft(cells, n, depth - 1, path, True)
+        cells[start] = cells[end]
+        cells[end] = EMPTY
+    return nodes
+
+
+def perft(board, depth, path="map", large=False):
+    """จำนวน node ปลายทางที่ความลึก depth เริ่มจากฝั่ง King เดิน
+    บอร์ดที่ checkmate() ตอบ Error จะได้ ValueError"""
+    if path not in PATHS:
+        raise ValueError("unknown path: %r" % (path,))
+    cells = bytearray()
+    n, _, error = parse_into(board, cells, [], large=large)
+    if error is not None:
+        raise ValueError(ERRORS[error])
+    if depth == 0:
+        return 1
+    return _perft(cells, n, depth, path, True)
+
+
+def measure(board, depth, paths=PATHS, large=False):
+    """รัน perft ทุก path คืน dict: path -> nodes, seconds, nodes_per_sec"""
+    report = {}
+    for path in paths:
+        start = time.perf_counter()
+        nodes = perft(board, depth, path, large)
+        seconds = time.perf_counter() - start
+        report[path] = {
+            "nodes": nodes,
+            "seconds": round(seconds, 6),
+            "nodes_per_sec": round(nodes / seconds, 1) if seconds else None,
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="perft ของบอร์ด checkmate")
+    parser.add_argument("file", help="ไฟล์บอร์ด ('-' = stdin) ใช้บอร์ดแรกในไฟล์")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--path", action="append", choices=PATHS,
+                        help="เลือกเฉพาะบาง path (ใส่ได้หลายครั้ง)")
+    parser.add_argument("--large", action="store_true")
+    args = parser.parse_args(argv)
+
+    board = next(iter(read_boards(args.file)))
+    report = measure(board, args.depth, args.path or PATHS, args.large)
+    print(json.dumps({"depth": args.depth, "paths": report}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
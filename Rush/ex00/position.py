@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# Position ที่แก้ได้ทีละตัว (place / remove / move) พร้อม Zobrist hash
+# และรู้ว่า King ถูกตีอยู่ไหมแบบ incremental: ดูใหม่เฉพาะเส้นจาก King ที่ผ่านช่องที่เปลี่ยน
+# เก็บไว้จำนวนมากได้: ใช้ __slots__ และ pack() เหลือช่องละครึ่ง byte
+import random
+
+from checkmate import EMPTY, KING, PAWN, ERRORS, Result, parse_into, evaluate_cells
+
+# ทิศที่มองออกจาก King -> ตัวที่ตี King ได้ถ้าเป็นตัวแรกที่เจอในทิศนั้น
+KING_DIRECTIONS = {
+    (-1, 0): b"RQ", (1, 0): b"RQ", (0, -1): b"RQ", (0, 1): b"RQ",
+    (-1, -1): b"BQ", (-1, 1): b"BQ", (1, -1): b"BQ", (1, 1): b"BQ",
+}
+PIECES = "PBRQK"
+
+# รหัสย่อของแต่ละช่องสำหรับ pack(): '.'=0 P=1 B=2 R=3 Q=4 K=5 ช่องละ 4 bit
+_TO_CODE = bytes.maketrans(b".PBRQK", bytes(range(6)))
+_FROM_CODE = bytes.maketrans(bytes(range(6)), b".PBRQK")
+_HIGH = bytes(b >> 4 for b in range(256))
+_LOW = bytes(b & 15 for b in range(256))
+
+# key ของ Zobrist แยกตามขนาดบอร์ด n
+_ZOBRIST = {}
+
+
+def zobrist_keys(n):
+    """key สุ่ม 64 bit ของแต่ละ (ตัวหมาก, ช่อง): keys[ord(piece)][square]
+    ใช้ seed ตายตัวเพื่อให้ hash ของบอร์ดเดียวกันเท่ากันทุกครั้งที่รัน"""
+    keys = _ZOBRIST.get(n)
+    if keys is None:
+        rng = random.Random(n)
+        keys = {}
+        for piece in PIECES:
+            keys[ord(piece)] = [rng.getrandbits(64) for _ in range(n * n)]
+        _ZOBRIST[n] = keys
+    return keys
+
+
+def _sign(x):
+    return (x > 0) - (x < 0)
+
+
+class Position:
+    """บอร์ด n x n ที่แก้ได้ ช่องเป็น (r, c) เหมือน Result.square"""
+
+    __slots__ = ("n", "cells", "king", "hash", "_keys", "_checks")
+
+    def __init__(self, n):
+        self.n = n
+        self.cells = bytearray(b"." * (n * n))
+        self.king = None
+        self.hash = 0
+        self._keys = zobrist_keys(n)
+        self._checks = {}  # ทิศจาก King -> ช่องของตัวที่ตีมาจากทิศนั้น
+
+    @classmethod
+    def from_board(cls, board, large=False):
+        """สร้างจากบอร์ดข้อความด้วย parse เดียวกับ checkmate()
+        บอร์ดที่ checkmate() ตอบ Error จะได้ ValueError"""
+        cells = bytearray()
+        n, king, error = parse_into(board, cells, [], large=large)
+        if error is not None:
+            raise ValueError(ERRORS[error])
+        return cls._load(n, cells, king)
+
+    @classmethod
+    def unpack(cls, n, data):
+        """สร้างคืนจาก bytes ที่ได้จาก pack()"""
+        cells = bytearray(len(data) * 2)
+        cells[0::2] = data.translate(_HIGH)
+        cells[1::2] = data.translate(_LOW)
+        del cells[n * n:]
+        cells = bytearray(cells.translate(_FROM_CODE))
+        king = cells.find(KING)
+        return cls._load(n, cells, king if king >= 0 else None)
+
+    @classmethod
+    def _load(cls, n, cells, king):
+        position = cls(n)
+        position.cells = cells
+        position.king = king
+        for square, code in enumerate(cells):
+            if code != EMPTY:
+                position.hash ^= position._keys[code][square]
+        position._rescan_all()
+        return position
+
+    def pack(self):
+        """บอร์ดแบบย่อ ช่องละ 4 bit (2 ช่องต่อ byte) ไว้เก็บทีละมาก ๆ
+        hash และทิศที่ถูกตีไม่ได้เก็บไว้ unpack() คำนวณใหม่ให้"""
+        codes = self.cells.translate(_TO_CODE)
+        if len(codes) % 2:
+            codes.append(0)
+        return bytes(high << 4 | low for high, low in zip(codes[0::2], codes[1::2]))
+
+    def copy(self):
+        other = Position(self.n)
+        other.cells = bytearray(self.cells)
+        other.king = self.king
+        other.hash = self.hash
+        other._checks = dict(self._checks)
+        return other
+
+    def _index(self, square):
+        r, c = square
+        if not (0 <= r < self.n and 0 <= c < self.n):
+            raise ValueError("square %r is off the board" % (square,))
+        return r * self.n + c
+
+    def piece_at(self, square):
+        """ตัวหมากที่ช่อง square หรือ None ถ้าว่าง"""
+        code = self.cells[self._index(square)]
+        if code == EMPTY:
+            return None
+        return chr(code)
+
+    def place(self, square, piece):
+        if piece not in PIECES or len(piece) != 1:
+            raise ValueError("unknown piece: %r" % (piece,))
+        index = self._index(square)
+        if self.cells[index] != EMPTY:
+            raise ValueError("square %r is occupied" % (square,))
+        if piece == 'K' and self.king is not None:
+            raise ValueError(ERRORS["two_kings"])
+        code = ord(piece)
+        self.cells[index] = code
+        self.hash ^= self._keys[code][index]
+        if code == KING:
+            self.king = index
+            self._rescan_all()
+        else:
+            self._changed(index)
+
+    def remove(self, square):
+        """เอาตัวที่ช่อง square ออก คืนตัวที่เอาออก"""
+        index = self._index(square)
+        code = self.cells[index]
+        if code == EMPTY:
+            raise ValueError("square %r is empty" % (square,))
+        self.cells[index] = EMPTY
+        self.hash ^= self._keys[code][index]
+        if code == KING:
+            self.king = None
+            self._checks.clear()
+        else:
+            self._changed(index)
+        return chr(code)
+
+    def move(self, start, end):
+        """ย้ายตัวจาก start ไป end ถ้า end มีตัวอยู่จะถูกกินออก
+        คืนตัวที่ถูกกิน หรือ None
+        ตรวจทั้งสองช่องก่อนแก้อะไร ถ้า ValueError บอร์ดจะยังเหมือนเดิม"""
+        if self.cells[self._index(start)] == EMPTY:
+            raise ValueError("square %r is empty" % (start,))
+        end_index = self._index(end)
+        piece = self.remove(start)
+        captured = None
+        if self.cells[end_index] != EMPTY:
+            captured = self.remove(end)
+        self.place(end, piece)
+        return captured
+
+    def _changed(self, index):
+        """ช่อง index เปลี่ยน: ถ้าอยู่บนเส้นจาก King ให้ดูเส้นนั้นใหม่เส้นเดียว"""
+        if self.king is None:
+            return
+        king_r, king_c = divmod(self.king, self.n)
+        r, c = divmod(index, self.n)
+        dr, dc = r - king_r, c - king_c
+        if dr and dc and abs(dr) != abs(dc):
+            return  # ไม่อยู่ในแนวตรงหรือแนวทแยงกับ King
+        self._rescan((_sign(dr), _sign(dc)))
+
+    def _rescan(self, direction):
+        dr, dc = direction
+        attackers = KING_DIRECTIONS[direction]
+        n = self.n
+        r, c = divmod(self.king, n)
+        r += dr
+        c += dc
+        first = True
+        while 0 <= r < n and 0 <= c < n:
+            code = self.cells[r * n + c]
+            if code != EMPTY:
+                # Pawn ตีได้เฉพาะตอนอยู่ทแยงล่างติดกับ King
+                if code in attackers or (code == PAWN and first and dr == 1 and dc):
+                    self._checks[direction] = r * n + c
+                    return
+                break
+            first = False
+            r += dr
+            c += dc
+        self._checks.pop(direction, None)
+
+    def _rescan_all(self):
+        self._checks.clear()
+        if self.king is not None:
+            for direction in KING_DIRECTIONS:
+                self._rescan(direction)
+
+    def is_attacked(self):
+        return bool(self._checks)
+
+    def result(self):
+        """Result แบบเดียวกับ evaluate() ของบอร์ดตอนนี้"""
+        if self.king is None:
+            return Result("Error", "no_king")
+        for direction in KING_DIRECTIONS:
+            square = self._checks.get(direction)
+            if square is not None:
+                return Result("Success", piece=chr(self.cells[square]),
+                              square=divmod(square, self.n))
+        return Result("Fail")
+
+    def evaluate(self, engine="auto", verbose=None, log=None, large=True):
+        """ตรวจใหม่ทั้งบอร์ดด้วย engine ของ checkmate (ไม่ใช้ผลแบบ incremental)
+        บอร์ดที่สร้างมาแล้วถือว่าผ่านขนาดแล้ว จึงให้ large=True เป็น default"""
+        return evaluate_cells(self.cells, self.n, engine, verbose, log, large)
+
+    def to_board(self):
+        n = self.n
+        return "\n".join(self.cells[r * n:(r + 1) * n].decode("ascii")
+                         for r in range(n))
+
+
+def evaluate_many(positions, engine="auto", large=True):
+    """ตรวจหลาย Position แบบ checkmate_many yield Result ทีละตัว"""
+    for position in positions:
+        yield evaluate_cells(position.cells, position.n, engine, large=large)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+import sys
+
+from checkmate import checkmate_many
+
+
+def _split_boards(lines):
+    """รวมบรรทัดเป็นบอร์ด บอร์ดคั่นกันด้วยบรรทัดว่าง
+    เก็บไว้แค่บอร์ดที่กำลังอ่านอยู่ ไม่โหลดทั้งไฟล์"""
+    rows = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line:
+            rows.append(line)
+        elif rows:
+            yield "\n".join(rows)
+            rows = []
+    if rows:
+        yield "\n".join(rows)
+
+
+def read_boards(source):
+    """อ่านบอร์ดทีละกระดานแบบ generator
+    source เป็น path ของไฟล์, '-' (stdin) หรือ iterable ของบรรทัด (เช่น file object)
+    รองรับทั้ง \\n และ \\r\\n และจะมีบรรทัดว่างท้ายไฟล์หรือไม่ก็ได้"""
+    if source == "-":
+        yield from _split_boards(sys.stdin)
+    elif isinstance(source, str):
+        with open(source) as lines:
+            yield from _split_boards(lines)
+    else:
+        yield from _split_boards(source)
+
+
+def check_boards(source, engine="auto"):
+    """ตรวจทุกบอร์ดจาก source โดยไม่อ่านทั้งไฟล์ก่อน yield Result ทีละบอร์ด"""
+    return checkmate_many(read_boards(source), engine=engine)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# ตัวรัน test แบบขนาน: หาฟังก์ชัน test_* ในไฟล์ test_*.py เองทั้งหมด
+# รันแต่ละ test ใน process ของตัวเอง (พร้อมกันได้หลายตัว) มี timeout ต่อ test
+# เพราะโจทย์บอกว่าฟังก์ชันต้องไม่วนไม่รู้จบ และรายงานเวลาของแต่ละ test
+#   python runtests.py                      ทุกไฟล์ test_*.py ใน directory นี้
+#   python runtests.py test_evil.py -j 8 --timeout 5 -k pawn
+import argparse
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import wait
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load(path):
+    directory, filename = os.path.split(os.path.abspath(path))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    return importlib.import_module(os.path.splitext(filename)[0])
+
+
+def discover(paths=None, keyword=None):
+    """list ของ (path, ชื่อฟังก์ชัน) เรียงตามไฟล์และตามบรรทัดที่เขียนไว้
+    paths เป็นไฟล์หรือ directory (default = directory ของไฟล์นี้)"""
+    files = []
+    for path in paths or [HERE]:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.startswith("test_") and name.endswith(".py"))
+        else:
+            files.append(path)
+    tests = []
+    for path in files:
+        module = _load(path)
+        found = [obj for name, obj in vars(module).items()
+                 if name.startswith("test_") and callable(obj)
+                 and getattr(obj, "__module__", None) == module.__name__]
+        found.sort(key=lambda func: func.__code__.co_firstlineno)
+        tests.extend((path, func.__name__) for func in found
+                     if keyword is None or keyword in func.__name__)
+    return tests
+
+
+def _run_one(path, name, conn):
+    """รันใน process ลูก: ส่ง (status, ข้อความ, output ที่ print, เวลา) กลับทาง conn"""
+    func = getattr(_load(path), name)
+    output = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            func()
+        status, message = "pass", ""
+    except AssertionError as e:
+        status, message = "fail", str(e) or traceback.format_exc(limit=-1).strip()
+    except Exception as e:
+        status, message = "error", "%s: %s" % (type(e).__name__, e)
+    conn.send((status, message, output.getvalue(), time.perf_counter() - start))
+    conn.close()
+
+
+def _context():
+    # fork ไม่ต้อง import ไฟล์ test ใหม่ในทุก process เลยเร็วกว่ามาก
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def run_tests(tests, workers=None, timeout=10.0, report=None):
+    """รัน tests (จาก discover) พร้อมกันไม่เกิน workers process
+    คืน list ของ dict: path, name, status, message, output, seconds
+    status เป็น "pass", "fail", "error", "timeout" หรือ "crash" (process ตาย)
+    report ถ้าส่งมาจะถูกเรียกกับผลแต่ละ test ทันทีที่เสร็จ"""
+    context = _context()
+    workers = workers or os.cpu_count() or 1
+    pending = deque(tests)
+    running = {}  # conn -> (process, path, name, เวลาเริ่ม)
+    results = []
+
+    def finish(conn, status, message="", output="", seconds=None):
+        process, path, name, start = running.pop(conn)
+        if seconds is None:
+            seconds = time.perf_counter() - start
+        process.join()
+        conn.close()
+        result = {"path": path, "name": name, "status": status,
+                  "message": message, "output": output, "seconds": seconds}
+        results.append(result)
+        if report is not None:
+            report(result)
+
+    while pending or running:
+        while pending and len(running) < workers:
+            path, name = pending.popleft()
+            receiver, sender = context.Pipe(duplex=False)
+            # ไม่ใช้ daemon เพราะบาง test (เช่น run_batch) สร้าง process ลูกต่อเอง
+            process = context.Process(target=_run_one, args=(path, name, sender))
+            process.start()
+            sender.close()
+            running[receiver] = (process, path, name, time.perf_counter())
+        now = time.perf_counter()
+        wait_for = min(start + timeout for _, _, _, start in running.values()) - now
+        for conn in wait(list(running), max(wait_for, 0)):
+            try:
+                finish(conn, *conn.recv())
+            except EOFError:
+                process = running[conn][0]
+                process.join()
+                finish(conn, "crash", "exit code %s" % process.exitcode)
+        now = time.perf_counter()
+        for conn, (process, _, _, start) in list(running.items()):
+            if now - start >= timeout:
+                process.kill()
+                finish(conn, "timeout", "took longer than %gs" % timeout)
+    return results
+
+
+def _print_result(result):
+    line = "  [%s] %s::%s (%.1f ms)" % (
+        result["status"].upper(), os.path.basename(result["path"]), result["name"],
+        result["seconds"] * 1000)
+    if result["status"] != "pass":
+        line += " - " + result["message"]
+        if result["output"]:
+            line += "\n" + result["output"].rstrip("\n")
+    print(line, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="รัน test_* แบบขนาน")
+    parser.add_argument("paths", nargs="*", help="ไฟล์ test หรือ directory")
+    parser.add_argument("-j", "--workers", type=int, help="จำนวน process (default = CPU)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="วินาทีต่อ test")
+    parser.add_argument("-k", dest="keyword", help="รันเฉพาะ test ที่ชื่อมีคำนี้")
+    parser.add_argument("--slowest", type=int, default=5, help="แสดง test ที่ช้าที่สุดกี่ตัว")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_tests(discover(args.paths, args.keyword), args.workers,
+                        args.timeout, _print_result)
+    elapsed = time.perf_counter() - start
+    failed = [r for r in results if r["status"] != "pass"]
+
+    print("\n" + "=" * 60)
+    print("  Results: %d passed, %d failed, %d total in %.2fs" % (
+        len(results) - len(failed), len(failed), len(results), elapsed))
+    if args.slowest and results:
+        print("  Slowest:")
+        for r in sorted(results, key=lambda r: r["seconds"], reverse=True)[:args.slowest]:
+            print("    %8.1f ms  %s::%s" % (r["seconds"] * 1000,
+                                           os.path.basename(r["path"]), r["name"]))
+    if failed:
+        print("  Failed tests:")
+        for r in failed:
+            print("    - %s::%s (%s)" % (os.path.basename(r["path"]), r["name"], r["status"]))
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# asyncio server สำหรับตรวจบอร์ด คุยกันด้วย JSON บรรทัดละ 1 ข้อความ
+#   ส่ง:   {"id": 1, "board": "R...\n.K..\n..P.\n...."}
+#   ได้:   {"id": 1, "verdict": "Success", "error": null, "piece": "R",
+#           "square": [0, 0], "message": "Success"}
+# คำขอจากทุก connection ถูกรวมเป็น batch เล็ก ๆ แล้วส่งให้ worker pool ตรวจ
+# รันเอง:  python server.py --port 8765   หรือ  python server.py --unix /tmp/checkmate.sock
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from checkmate import ENGINES, checkmate_many
+
+# ความยาวสูงสุดของหนึ่งบรรทัด (หนึ่งคำขอ/คำตอบ) ค่า default ของ asyncio คือ 64 KiB
+# พอสำหรับบอร์ดไม่เกิน MAX_SIZE แต่ไม่พอสำหรับบอร์ดใหญ่ตอน large=True
+LINE_LIMIT = 1 << 16
+LARGE_LINE_LIMIT = 1 << 24  # บอร์ดได้ถึงประมาณ 4000 x 4000
+
+
+def _check_batch(boards, engine, large):
+    return list(checkmate_many(boards, engine=engine, large=large))
+
+
+def result_to_dict(result):
+    return {
+        "verdict": result.verdict,
+        "error": result.error,
+        "piece": result.piece,
+        "square": list(result.square) if result.square else None,
+        "message": result.message,
+    }
+
+
+class CheckmateServer:
+    """รวมคำขอเป็น batch (ไม่เกิน batch_size หรือรอไม่เกิน max_delay วินาที)
+    แล้วตรวจใน executor ค้างได้ไม่เกิน max_in_flight คำขอ เกินกว่านั้น
+    connection จะหยุดอ่านจนกว่าจะมีที่ว่าง (backpressure)
+    executor ถ้าไม่ส่งมาจะสร้าง ProcessPoolExecutor เองและปิดให้ตอน close()
+    line_limit: ความยาวบรรทัดสูงสุด (default ตาม large) บรรทัดที่ยาวกว่านี้ได้ bad_request"""
+
+    def __init__(self, batch_size=256, max_delay=0.002, max_in_flight=1024,
+                 executor=None, engine="auto", large=False, line_limit=None):
+        if engine != "auto" and engine not in ENGINES:
+            raise ValueError("unknown engine: %r" % (engine,))
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.engine = engine
+        self.large = large
+        if line_limit is None:
+            line_limit = LARGE_LINE_LIMIT if large else LINE_LIMIT
+        self.line_limit = line_limit
+        self._own_executor = executor is None
+        self._executor = executor
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._queue = asyncio.Queue()
+        self._batcher = None
+        self._dispatching = set()
+        self._servers = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        if self._batcher is None:
+            self._batcher = asyncio.ensure_future(self._run_batches())
+
+    async def start_tcp(self, host="127.0.0.1", port=0):
+        """เปิด TCP server คืน asyncio.Server (port=0 ให้ระบบเลือก port ให้)"""
+        await self.start()
+        server = await asyncio.start_server(self._handle, host, port,
+                                            limit=self.line_limit)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path):
+        await self.start()
+        server = await asyncio.start_unix_server(self._handle, path,
+                                                 limit=self.line_limit)
+        self._servers.append(server)
+        return server
+
+    async def close(self):
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+        for task in list(self._dispatching):
+            task.cancel()
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def evaluate(self, board):
+        """ตรวจบอร์ดหนึ่งกระดาน (ใช้ใน process เดียวกันได้เลย ไม่ต้องผ่าน socket)"""
+        async with self._slots:
+            future = asyncio.get_running_loop().create_future()
+            await self._queue.put((board, future))
+            return await future
+
+    async def _run_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # ส่ง batch ออกไปแล้วรวม batch ถัดไปต่อเลย ให้ทุก worker ใน pool ได้ทำงาน
+            # (จำนวน batch ที่ค้างถูกจำกัดด้วย max_in_flight อยู่แล้ว)
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._dispatching.add(task)
+            task.add_done_callback(self._dispatching.discard)
+
+    async def _dispatch(self, batch):
+        boards = [board for board, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _check_batch, boards, self.engine, self.large)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _handle(self, reader, writer):
+        tasks = set()
+        try:
+            while True:
+                line = await self._read_line(reader)
+                if not line and line is not None:
+                    break
+                # รอที่ว่างก่อนอ่านบรรทัดถัดไป ถ้าค้างเยอะเกินก็หยุดอ่านไปเลย
+                await self._slots.acquire()
+                task = asyncio.ensure_future(self._reply(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_line(reader):
+        """อ่านหนึ่งบรรทัด คืน b"" ตอนหมด หรือ None ถ้ายาวเกิน line_limit
+        (บรรทัดที่ยาวเกินจะถูกอ่านทิ้งจนถึง '\\n' เพื่อให้บรรทัดถัดไปยังอ่านได้)"""
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as error:
+            return error.partial  # บรรทัดสุดท้ายไม่มี '\n' ปิด
+        except asyncio.LimitOverrunError as error:
+            consumed = error.consumed
+        while True:
+            await reader.readexactly(consumed)
+            try:
+                await reader.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as error:
+                consumed = error.consumed
+
+    async def _reply(self, line, writer):
+        # ถือ slot ไว้จนเขียนคำตอบเสร็จ (drain) ถ้า client ไม่อ่าน คำขอที่ค้าง
+        # จะเต็ม max_in_flight แล้ว server จะหยุดอ่านคำขอใหม่
+        try:
+            try:
+                request = json.loads(line)
+                request_id = request.get("id")
+                board = request["board"]
+            except (TypeError, ValueError, AttributeError, KeyError):
+                reply = {"id": None, "error": "bad_request"}
+            else:
+                future = asyncio.get_running_loop().create_future()
+                await self._queue.put((board, future))
+                try:
+                    reply = result_to_dict(await future)
+                except Exception:
+                    # worker พัง (เช่น process ใน pool ตาย) ตอบ error แทนการเงียบไป
+                    reply = {"error": "server_error"}
+                reply["id"] = request_id
+            writer.write(json.dumps(reply).encode() + b"\n")
+            await writer.drain()
+        finally:
+            self._slots.release()
+
+
+class Client:
+    """client ง่าย ๆ สำหรับคุยกับ CheckmateServer ผ่าน socket
+    ส่งได้ทีละหลายคำขอ คำตอบจับคู่กันด้วย id"""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting = {}
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect_tcp(cls, host, port, limit=LARGE_LINE_LIMIT):
+        return cls(*await asyncio.open_connection(host, port, limit=limit))
+
+    @classmethod
+    async def connect_unix(cls, path, limit=LARGE_LINE_LIMIT):
+        return cls(*await asyncio.open_unix_connection(path, limit=limit))
+
+    async def check(self, board):
+        """ส่งบอร์ดไปตรวจ คืน dict แบบ result_to_dict"""
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        message = json.dumps({"id": request_id, "board": board})
+        self._writer.write(message.encode() + b"\n")
+        await self._writer.drain()
+        return await future
+
+    async def _receive(self):
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                break
+            reply = json.loads(line)
+            future = self._waiting.pop(reply.pop("id"), None)
+            if future is not None and not future.done():
+                future.set_result(reply)
+        for future in self._waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError("server closed connection"))
+
+    async def close(self):
+        self._writer.close()
+        await self._receiver
+
+
+async def _serve(args):
+    async with CheckmateServer(args.batch_size, args.max_delay, args.max_in_flight,
+                               engine=args.engine, large=args.large) as server:
+        if args.unix:
+            listener = await server.start_unix(args.unix)
+        else:
+            listener = await server.start_tcp(args.host, args.port)
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="asyncio server ตรวจบอร์ด")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="ฟังที่ Unix socket นี้แทน TCP")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--max-delay", type=float, default=0.002,
+                        help="รอรวม batch นานสุดกี่วินาที")
+    parser.add_argument("--max-in-flight", type=int, default=1024)
+    parser.add_argument("--engine", choices=("auto",) + ENGINES, default="auto")
+    parser.add_argument("--large", action="store_true")
+    try:
+        asyncio.run(_serve(parser.parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import random
+
+from checkmate import evaluate
+from attackmap import AttackMap
+
+def test_rook_blocked_by_pawn():
+    attacks = AttackMap.from_board("R.P.\n....\n....\n....")
+    assert attacks.is_attacked((0, 1)) and attacks.is_attacked((0, 2))
+    assert not attacks.is_attacked((0, 3))      # Pawn ขวางไว้
+    assert attacks.attackers((3, 0)) == [("R", (0, 0))]
+    assert attacks.attackers((0, 2)) == [("R", (0, 0))]
+
+def test_pawn_attacks_upwards_only():
+    attacks = AttackMap.from_board("...\n.P.\n...")
+    assert attacks.attacked_squares() == [(0, 0), (0, 2)]
+
+def test_transparent_king():
+    """King ที่ถูก Rook ตีอยู่ ถอยไปตามแนวเดิมก็ยังโดน"""
+    cells = bytearray(b"R.K.............")
+    assert not AttackMap.from_cells(cells, 4).is_attacked((0, 3))
+    assert AttackMap.from_cells(cells, 4, transparent=2).attackers((0, 3)) == \
+        [("R", (0, 0))]
+
+def test_matches_checkmate_on_every_square():
+    """ช่องที่ถูกตีในแผนที่ ต้องตรงกับการวาง King ลงไปแล้วเรียก evaluate()"""
+    rng = random.Random(20)
+    for _ in range(200):
+        n = rng.randint(1, 8)
+        cells = [rng.choice("......PBRQ") for _ in range(n * n)]
+        attacks = AttackMap.from_board("\n".join(
+            "".join(cells[r * n:(r + 1) * n]) for r in range(n)))
+        for square in range(n * n):
+            if cells[square] != ".":
+                continue
+            trial = list(cells)
+            trial[square] = "K"
+            result = evaluate("\n".join(
+                "".join(trial[r * n:(r + 1) * n]) for r in range(n)))
+            at = divmod(square, n)
+            assert attacks.is_attacked(at) == (result.verdict == "Success")
+            if result.verdict == "Success":
+                assert (result.piece, result.square) in attacks.attackers(at)
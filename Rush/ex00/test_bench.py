@@ -0,0 +1,24 @@
+import json
+import random
+
+from bench import SCENARIOS, random_board, run_benchmarks
+from checkmate import evaluate
+
+def test_random_board_is_seeded():
+    a = random_board(random.Random(1), 8, 0.3)
+    b = random_board(random.Random(1), 8, 0.3)
+    assert a == b and a.count("K") == 1
+
+def test_verdict_scenarios():
+    """scenario attacked/safe ต้องได้ verdict ตามชื่อ"""
+    rng = random.Random(0)
+    for name, verdict in (("attacked-8x8", "Success"), ("safe-8x8", "Fail")):
+        make, large = SCENARIOS[name]
+        assert all(evaluate(make(rng)).verdict == verdict for _ in range(20))
+
+def test_report_is_json():
+    report = run_benchmarks(count=5, scenarios=["enclosed-queen", "errors"],
+                            engines=["auto", "reverse"])
+    stats = json.loads(json.dumps(report))["scenarios"]["enclosed-queen"]["auto"]
+    assert stats["boards"] == 5
+    assert set(stats) >= {"boards_per_sec", "p50_us", "p99_us", "peak_kib"}
@@ -0,0 +1,65 @@
+import os
+import tempfile
+
+from binformat import encode_board, write_boards, read_records, check_file
+from checkmate import evaluate, evaluate_cells
+
+BOARDS = [
+    "R...\n.K..\n..P.\n....",
+    "....\n.K..\n....\n....",
+    "RxZz\nxKxx\nxxPx\nxxxx",
+    "K...\n..K.\n....\n....",
+    "....\n....\n....\n....",
+    "..Q.\n.ก..\n....\n..K.",
+]
+
+def test_encode_normalizes():
+    """ตัวที่ไม่ใช่ PBRQK (รวมถึง unicode) กลายเป็น '.'"""
+    assert encode_board("Rx\nKก", 2) == b"R.K."
+
+def test_encode_wrong_size():
+    try:
+        encode_board("K..\n...", 3)
+    except ValueError:
+        return
+    assert False, "non 3x3 board should raise ValueError"
+
+def test_round_trip_matches_text():
+    """ผลจากไฟล์ binary ต้องตรงกับการตรวจจากข้อความ"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "boards.bin")
+        assert write_boards(path, BOARDS, 4) == len(BOARDS)
+        records = [(n, bytes(record)) for n, record in read_records(path)]
+        assert records[0] == (4, b"R....K....P.....")
+        assert list(check_file(path)) == [evaluate(b) for b in BOARDS]
+
+def test_empty_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "empty.bin")
+        write_boards(path, [], 8)
+        assert list(read_records(path)) == []
+
+def test_truncated_record_raises():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "boards.bin")
+        write_boards(path, BOARDS[:2], 4)
+        with open(path, "ab") as f:
+            f.write(b"R..")
+        try:
+            list(read_records(path))
+        except ValueError as e:
+            assert "truncated" in str(e)
+            return
+    assert False, "truncated file should raise ValueError"
+
+def test_cells_with_junk_bytes():
+    """byte ที่ไม่ใช่ PBRQK เป็นช่องว่าง ไม่ crash"""
+    assert evaluate_cells(b"Kx..", 2).message == "Fail"
+    assert evaluate_cells(memoryview(b"K\x00\xffR"), 2).message == "Fail"
+    assert evaluate_cells(b"KxzR", 2, engine="scan").message == "Fail"
+    assert evaluate_cells(b"K.R.", 2).message == "Success"
+    try:
+        evaluate_cells(b"K..", 2)
+    except ValueError:
+        return
+    assert False, "wrong number of cells should raise ValueError"
@@ -0,0 +1,59 @@
+from cache import VerdictCache, cache_key
+from checkmate import checkmate_many, evaluate
+
+def test_key_ignores_junk():
+    """บอร์ดที่ต่างกันแค่ตัวขยะ/ขึ้นบรรทัด ต้องได้ key เดียวกัน"""
+    assert cache_key("Rx\r\nzK\n") == cache_key("R.\n.K") == b"R.\n.K"
+
+def test_key_keeps_shape():
+    assert cache_key("RK\n..") != cache_key("RK..")
+
+def test_hits_and_misses():
+    cache = VerdictCache()
+    boards = ["R...\n.K..\n..P.\n....", "Rzzz\nzKzz\nzzPz\nzzzz", "..\n.K", "KK"]
+    results = list(checkmate_many(boards, cache=cache))
+    assert [r.message for r in results] == [
+        "Success", "Success", "Fail", "Error: Board is not square"]
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 3)
+
+def test_lru_eviction():
+    cache = VerdictCache(maxsize=2)
+    evaluate("K", cache=cache)
+    evaluate("..\n.K", cache=cache)
+    evaluate("K", cache=cache)          # "K" ใช้ล่าสุด
+    evaluate("RK\n..", cache=cache)     # ต้องทิ้ง "..\n.K"
+    assert cache.evictions == 1
+    assert cache.get(cache_key("K")) is not None
+    assert cache.get(cache_key("..\n.K")) is None
+
+def test_fifo_eviction():
+    cache = VerdictCache(maxsize=2, policy="fifo")
+    evaluate("K", cache=cache)
+    evaluate("..\n.K", cache=cache)
+    evaluate("K", cache=cache)
+    evaluate("RK\n..", cache=cache)     # fifo ทิ้ง "K" ที่ใส่ก่อน
+    assert cache.get(cache_key("K")) is None
+    assert cache.get(cache_key("..\n.K")) is not None
+
+def test_large_flag_is_part_of_key():
+    """ผล "Board is too big" ที่ cache ไว้ต้องไม่ถูกใช้ตอนส่ง large=True"""
+    cache = VerdictCache()
+    board = "\n".join(["K" + "." * 8] + ["R" + "." * 8] + ["." * 9] * 7)
+    assert evaluate(board, cache=cache).message == "Error: Board is too big"
+    assert evaluate(board, cache=cache, large=True).message == "Success"
+    assert evaluate(board, cache=cache).message == "Error: Board is too big"
+    assert cache_key(board, large=True) != cache_key(board)
+
+def test_fast_key_matches_line_splitting():
+    """key จาก translate ต้องเท่ากับการแยกแถวด้วย splitlines() แบบเดิม
+    และบอร์ดที่ key เท่ากันต้องได้ผลเหมือนกัน"""
+    import random, re
+    rng = random.Random(10)
+    seen = {}
+    for _ in range(5000):
+        board = "".join(rng.choice("..PBRQKx \n\n\r\x0bé") for _ in range(rng.randint(0, 12)))
+        slow = re.sub(r"[^PBRQK\n]", ".", "\n".join(board.splitlines())).encode()
+        key = cache_key(board)
+        assert key == (slow if board else b"\0"), repr(board)
+        message = evaluate(board).message
+        assert seen.setdefault(key, message) == message, repr(board)
@@ -1,18 +1,27 @@
-from checkmate import checkmate
+from checkmate import checkmate, ray_table, ENGINES, checkmate_many, evaluate, Result
+from checkmate import parse_into, _parse_rows, Stats
+import checkmate as checkmate_module
+import bitboard
+import vectorized
 
 # =============================================================================
-#  Helper: เรียก checkmate แล้ว capture stdout เพื่อเทียบผลลัพธ์
+#  Helper: เรียก evaluate แล้วเอาข้อความผลลัพธ์มาเทียบ (ไม่ต้องสลับ stdout)
 # =============================================================================
 import io, sys
 
 def run(board):
-    """คืนค่า string ที่ checkmate() print ออกมา (ตัดช่องว่างท้ายบรรทัด)"""
-    buf = io.StringIO()
-    old = sys.stdout
-    sys.stdout = buf
-    checkmate(board)
-    sys.stdout = old
-    return buf.getvalue().strip()
+    """คืนข้อความที่ checkmate() จะ print ออกมา
+    รันทุก engine (และแบบ vectorized ถ้ามี numpy) แล้วเช็คว่าได้คำตอบตรงกัน"""
+    names = list(ENGINES)
+    results = []
+    for engine in ENGINES:
+        results.append(evaluate(board, engine=engine).message)
+    if vectorized.np is not None:
+        names.append("vectorized")
+        results.append(vectorized.evaluate_many([board])[0])
+    assert results.count(results[0]) == len(results), \
+        f"engines disagree: {dict(zip(names, results))}"
+    return results[0]
 
 # =============================================================================
 #  1. ตัวอย่างจากโจทย์ (Subject Examples)
@@ -477,91 +486,343 @@ R..B
     assert run(board) == "Fail"
 
 # =============================================================================
-#  Run all tests
+#  15. Ray Tables  (ตาราง ray ที่คำนวณไว้ล่วงหน้า)
 # =============================================================================
-if __name__ == "__main__":
-    tests = [
-        # Subject examples
-        ("Example1 (Rook checks King)", test_example1),
-        ("Example2 (No enemy)", test_example2),
-        # Pawn
-        ("Pawn check left diagonal", test_pawn_check_left_diagonal),
-        ("Pawn check right diagonal", test_pawn_check_right_diagonal),
-        ("Pawn no check same column", test_pawn_no_check_same_column),
-        ("Pawn no check behind", test_pawn_no_check_behind),
-        ("Pawn no check too far", test_pawn_no_check_too_far),
-        # Rook
-        ("Rook check horizontal", test_rook_check_horizontal),
-        ("Rook check vertical", test_rook_check_vertical),
-        ("Rook blocked by piece", test_rook_blocked_by_piece),
-        ("Rook no check diagonal", test_rook_no_check_diagonal),
-        # Bishop
-        ("Bishop check diagonal", test_bishop_check_diagonal),
-        ("Bishop blocked", test_bishop_blocked),
-        ("Bishop no check straight", test_bishop_no_check_straight),
-        # Queen
-        ("Queen check horizontal", test_queen_check_horizontal),
-        ("Queen check diagonal", test_queen_check_diagonal),
-        ("Queen blocked", test_queen_blocked),
-        # Blocking
-        ("Rook blocked by another enemy", test_rook_blocked_by_another_enemy),
-        ("Queen blocked by pawn vertical", test_queen_blocked_by_pawn_vertical),
-        # Multiple enemies
-        ("Multiple enemies one checks", test_multiple_enemies_one_checks),
-        ("Multiple enemies none checks", test_multiple_enemies_none_checks),
-        # Board sizes
-        ("1x1 King only", test_1x1_king_only),
-        ("2x2 board", test_2x2_board),
-        ("3x3 board", test_3x3_board),
-        ("5x5 board", test_5x5_board),
-        ("8x8 standard (safe)", test_8x8_standard),
-        ("8x8 Rook check", test_8x8_rook_check),
-        # Edge/corner
-        ("King corner check", test_king_corner_check),
-        ("King corner Rook same col", test_king_corner_rook_same_col),
-        ("King edge Queen diagonal", test_king_edge),
-        # Error handling
-        ("No King", test_no_king),
-        ("Two Kings", test_two_kings),
-        ("Not square board", test_not_square_board),
-        ("Board too big", test_board_too_big),
-        ("Empty board", test_empty_board),
-        ("Unknown chars as empty", test_unknown_characters_treated_as_empty),
-        # Pawn edge cases
-        ("Pawn top row", test_pawn_top_row),
-        ("Pawn same row", test_pawn_adjacent_same_row),
-        # Bishop long range
-        ("Bishop long diagonal miss", test_bishop_long_diagonal),
-        ("Bishop full diagonal 8x8", test_bishop_full_diagonal_8x8),
-        # Queen combined
-        ("Queen vertical check", test_queen_vertical_check),
-        ("Queen all blocked", test_queen_all_directions_fail),
-        # Piece blocks piece
-        ("Enemy blocks enemy", test_enemy_blocks_enemy),
+def test_ray_table_cached():
+    """เรียก ray_table ขนาดเดิมซ้ำ ต้องได้ตารางเดิม (ไม่สร้างใหม่)"""
+    assert ray_table(4) is ray_table(4)
+
+def test_ray_table_rook_corner():
+    """Rook มุมซ้ายบนของ 3x3 มี 2 ray: ลง และ ขวา"""
+    rays = ray_table(3)['R'][0]
+    assert sorted(rays) == [(1, 2), (3, 6)]
+
+def test_ray_table_pawn_one_square():
+    """Pawn ตรงกลาง 3x3 ตีได้แค่ทแยงบน 1 ช่อง"""
+    assert ray_table(3)['P'][4] == ((0,), (2,))
+
+# =============================================================================
+#  16. Reverse Scan  (ยิง ray จาก King ออกไปแทน)
+# =============================================================================
+def test_reverse_engine_crowded_pawns():
+    """Pawn เต็มกระดาน แต่มี Pawn ตัวเดียวที่ตี King ได้"""
+    board = """\
+PPPPP
+PPPPP
+P.K.P
+PP.PP
+PPPPP"""
+    assert run(board) == "Success"
+
+def test_reverse_engine_first_blocker_wins():
+    """จาก King มองขึ้นไปเจอ Pawn ก่อน Rook → Rook ถูกบัง"""
+    board = """\
+..R..
+..P..
+.....
+..K..
+....."""
+    assert run(board) == "Fail"
+
+def test_unknown_engine():
+    """ชื่อ engine ที่ไม่รู้จัก → ValueError"""
+    try:
+        checkmate("K", engine="nope")
+    except ValueError:
+        return
+    assert False, "unknown engine should raise ValueError"
+
+# =============================================================================
+#  17. Bitboard  (บอร์ดไม่เกิน 8x8 เก็บเป็น int)
+# =============================================================================
+def _bitboard_attacker(board, king):
+    """หาตัวที่ตีช่อง king ผ่าน from_cells + attacker_of"""
+    rows = board.splitlines()
+    cells = bytearray("".join(rows), "ascii")
+    return bitboard.attacker_of(king, *bitboard.from_cells(cells, len(rows)))
+
+def test_bitboard_attacker_stops_at_blocker():
+    """King ที่ (0,0) Rook ที่ (0,7) ถ้ามีตัวขวางที่ (0,3) → ตีไม่ถึง"""
+    empty = "\n" + "\n".join(["........"] * 7)
+    assert _bitboard_attacker("K......R" + empty, 0) == 7
+    assert _bitboard_attacker("K..B...R" + empty, 0) is None
+
+def test_bitboard_no_wrap_around():
+    """King ขอบขวา (0,7) ตัวที่ bit ติดกันแต่อยู่อีกฝั่งของบอร์ดต้องตีไม่ได้"""
+    rows = ["........"] * 8
+    rows[0] = ".......K"
+    for square, piece in ((8, "R"), (16, "B"), (16, "P"), (14, "P")):
+        board = [list(row) for row in rows]
+        board[square // 8][square % 8] = piece
+        text = "\n".join("".join(row) for row in board)
+        expected = 14 if piece == "P" and square == 14 else None
+        assert _bitboard_attacker(text, 7) == expected, (square, piece)
+
+def test_bitboard_small_board_padding():
+    """บอร์ด 3x3 ใช้ stride 8 ได้ Rook ไม่ทะลุขอบไปแถวถัดไป"""
+    board = """\
+..R
+K..
+..."""
+    assert run(board) == "Fail"
+    # King (1,0) อยู่ที่ bit 8 ไม่ใช่ 3 จึงไม่ติดกับ Rook ที่ (0,2) (bit 2)
+    # ส่วน (2,0) อยู่ที่ bit 16 ray ลงล่างจาก bit 0 ต้องไปถึง ไม่ใช่ bit 6
+    assert _bitboard_attacker(board, 8) is None
+    assert _bitboard_attacker("K..\n...\nR..", 0) == 16
+    assert _bitboard_attacker(".K.\n..P\n...", 1) == 10
+
+def test_bitboard_from_cells():
+    """บอร์ด 3x3 แบบแบน → bit ที่ r * 8 + c และหาตัวที่ตีจาก King ได้"""
+    cells = bytearray(b"Q.." b".K." b"..R")
+    pawns, orthogonal, diagonal, occupied = bitboard.from_cells(cells, 3)
+    assert pawns == 0
+    assert orthogonal == (1 << 0) | (1 << 18)
+    assert diagonal == 1 << 0
+    assert occupied == (1 << 0) | (1 << 9) | (1 << 18)
+    assert bitboard.attacker_of(9, pawns, orthogonal, diagonal, occupied) == 0
+
+# =============================================================================
+#  18. Batch API  (checkmate_many ตรวจหลายบอร์ด)
+# =============================================================================
+def test_checkmate_many_generator():
+    """รับ generator ได้ และคืนผลตามลำดับ"""
+    boards = (b for b in ["R...\n.K..\n..P.\n....", "..\n.K", "KK", 42])
+    assert [r.message for r in checkmate_many(boards)] == [
+        "Success", "Fail", "Error: Board is not square",
+        "Error: Board is not a string"]
+
+def test_checkmate_many_lazy():
+    """ต้องไม่อ่าน iterable ล่วงหน้า"""
+    seen = []
+    def boards():
+        for b in ["K", "RK\n.."]:
+            seen.append(b)
+            yield b
+    results = checkmate_many(boards())
+    assert next(results).verdict == "Fail" and seen == ["K"]
+    assert next(results).verdict == "Success"
+
+# =============================================================================
+#  19. Result  (ผลแบบมีโครงสร้าง ไม่ต้อง print)
+# =============================================================================
+def test_result_attacker():
+    """Success ต้องบอกตัวที่ตีและตำแหน่ง ทุก engine"""
+    board = """\
+....
+R.K.
+....
+...."""
+    for engine in ENGINES:
+        assert evaluate(board, engine=engine) == Result("Success", piece="R", square=(1, 0))
+
+def test_result_error_code():
+    """Error ต้องมีรหัส error"""
+    result = evaluate("K.\nK.")
+    assert result.verdict == "Error" and result.error == "two_kings"
+    assert result.message == "Error: Can only have one King"
+
+def test_checkmate_still_prints():
+    """checkmate() ยัง print ผลลัพธ์เหมือนเดิม"""
+    buf = io.StringIO()
+    old = sys.stdout
+    sys.stdout = buf
+    checkmate("R...\n.K..\n..P.\n....")
+    sys.stdout = old
+    assert buf.getvalue().strip().splitlines()[-1] == "Success"
+
+# =============================================================================
+#  20. Debug Output  (ปิดเป็นค่าเริ่มต้น เปิดได้ต่อครั้งหรือผ่าน env)
+# =============================================================================
+def test_checkmate_prints_only_verdict():
+    """ค่าเริ่มต้นต้อง print แค่ผลลัพธ์ ไม่ print บอร์ด"""
+    buf = io.StringIO()
+    old = sys.stdout
+    sys.stdout = buf
+    checkmate("R...\n.K..\n..P.\n....", verbose=False)
+    sys.stdout = old
+    assert buf.getvalue() == "Success\n"
+
+def test_checkmate_many_collects_debug():
+    """checkmate_many เก็บข้อมูล debug ลง buffer ได้"""
+    log = io.StringIO()
+    list(checkmate_many(["RK\n..", ".."], verbose=True, log=log))
+    assert log.getvalue().splitlines() == [
+        "board: ['RK', '..']",
+        "king: (0, 1)",
+        "enemies: [('R', 0, 0)]",
+        "board: ['..']",
     ]
 
-    passed = 0
-    failed = 0
-    errors = []
-
-    for name, func in tests:
-        try:
-            func()
-            print(f"  [PASS] {name}")
-            passed += 1
-        except AssertionError as e:
-            print(f"  [FAIL] {name} - {e}")
-            failed += 1
-            errors.append(name)
-        except Exception as e:
-            print(f"  [FAIL] {name} - {type(e).__name__}: {e}")
-            failed += 1
-            errors.append(name)
-
-    print(f"\n{'='*50}")
-    print(f"  Results: {passed} passed, {failed} failed, {passed + failed} total")
-    if errors:
-        print(f"  Failed tests:")
-        for e in errors:
-            print(f"    - {e}")
-    print(f"{'='*50}")
+def test_debug_env_variable():
+    """CHECKMATE_DEBUG=1 เปิด debug เมื่อไม่ได้ส่ง verbose มา"""
+    import os
+    log = io.StringIO()
+    os.environ["CHECKMATE_DEBUG"] = "1"
+    try:
+        evaluate("K", log=log)
+    finally:
+        del os.environ["CHECKMATE_DEBUG"]
+    assert "king: (0, 0)" in log.getvalue()
+
+# =============================================================================
+#  21. Vectorized  (ตรวจทั้ง batch ด้วย numpy)
+# =============================================================================
+def test_vectorized_mixed_batch():
+    """batch ที่มีหลายขนาดและบอร์ดเสีย ต้องได้ลำดับและผลเหมือน evaluate"""
+    if vectorized.np is None:
+        return  # ไม่มี numpy
+    boards = ["R...\n.K..\n..P.\n....", "KK\n..", "..\n.K", "K..\n..", 7,
+              "..\n..", "B..\n...\n..K"]
+    assert vectorized.evaluate_many(boards) == [evaluate(b).message for b in boards]
+
+def test_vectorized_same_length_group():
+    """บอร์ดที่ยาวเท่ากันแต่ตัวขึ้นบรรทัดอยู่ผิดที่ ต้องได้ผลเหมือน evaluate()"""
+    if vectorized.np is None:
+        return  # ไม่มี numpy
+    boards = ["R..\n.K.\n...", "R..\n.K.\n...\n", "R...K\n.\n..", "R..\r.K.\r...",
+              "R..\x0c.K.\n...", "R..\r\n.K.\r\n...", "K.Q\n...\n..B", ".........K.",
+              "R..\n.K.\n..." * 3, "ก..\n.K.\nR.."]
+    expected = [evaluate(b, large=True).message for b in boards]
+    assert vectorized.evaluate_many(boards, large=True) == expected
+    assert vectorized.evaluate_many(boards[:2] * 500) == [expected[0], expected[1]] * 500
+
+# =============================================================================
+#  22. Large Boards  (large=True รับบอร์ดใหญ่กว่า 8x8)
+# =============================================================================
+def test_large_board_opt_in():
+    """บอร์ด 9x9 เป็น error ตามปกติ แต่ตรวจได้ถ้าส่ง large=True"""
+    board = "\n".join(["R...K...."] + ["." * 9] * 8)
+    assert evaluate(board).message == "Error: Board is too big"
+    for engine in ENGINES:
+        result = evaluate(board, engine=engine, large=True)
+        assert result == Result("Success", piece="R", square=(0, 0)), engine
+
+def test_large_board_300():
+    """บอร์ด 300x300: Queen ทแยงไกล ถูกบังด้วย Pawn แล้วเอาออก"""
+    n = 300
+    rows = [["."] * n for _ in range(n)]
+    rows[150][150] = "K"
+    rows[10][290] = "Q"
+    rows[149][151] = "P"   # ทแยงบนขวาติด King: Pawn ตีลงไม่ได้ แต่บัง Queen
+    board = "\n".join("".join(row) for row in rows)
+    assert evaluate(board, large=True).verdict == "Fail"
+    rows[149][151] = "."
+    board = "\n".join("".join(row) for row in rows)
+    assert evaluate(board, large=True) == Result("Success", piece="Q", square=(10, 290))
+
+def test_large_board_engines_agree():
+    """บอร์ดสุ่ม 9x9 ถึง 20x20 ทุก engine ต้องตอบตรงกัน และตรงกับการยิง ray
+    จาก King แบบ "reverse" (บอร์ดเกิน 8x8 ทุก engine ใช้ "indexed")"""
+    import random
+    rng = random.Random(13)
+    for _ in range(300):
+        n = rng.randint(9, 20)
+        cells = [rng.choice("......PRBQx") for _ in range(n * n)]
+        cells[rng.randrange(n * n)] = "K"
+        board = "\n".join("".join(cells[r * n:(r + 1) * n]) for r in range(n))
+        verdicts = {evaluate(board, engine=e, large=True).verdict for e in ENGINES}
+        flat = bytearray("".join(cells).replace("x", "."), "ascii")
+        attacker = checkmate_module._scan_from_king(flat, n, flat.index(b"K"))
+        assert verdicts == {"Fail" if attacker is None else "Success"}, board
+
+def test_large_board_skips_ray_table():
+    """engine="scan"/"reverse" บนบอร์ดเกิน 8x8 ต้องไม่สร้างตาราง ray O(n^3)"""
+    board = "\n".join(["R...K...." + "." * 31] + ["." * 40] * 39)
+    for engine in ("scan", "reverse"):
+        result = evaluate(board, engine=engine, large=True)
+        assert result == Result("Success", piece="R", square=(0, 0)), engine
+    assert 40 not in checkmate_module._RAY_TABLES
+
+# =============================================================================
+#  23. Parser  (parse รอบเดียว ต้องได้ผลเหมือน parse ทีละแถวแบบเดิม)
+# =============================================================================
+def test_parse_single_pass_matches_rows():
+    """ทั้งบอร์ดปกติ, CRLF, บรรทัดว่างท้าย, ตัวขยะ, unicode และบอร์ดเสีย"""
+    boards = ["R...\n.K..\n..P.\n....", "R...\r\n.K..\r\n..P.\r\n....\r\n",
+              "RxZz\nxKxx\nxxPx\nxxxx", "K\n\n", "K.\n..\n", "ก.\n.K",
+              "KK\n..", "..\n..", "K..\n...\n..", "K\r.\n..", ""]
+    for board in boards:
+        fast_cells, fast_pieces = bytearray(), []
+        slow_cells, slow_pieces = bytearray(), []
+        fast = parse_into(board, fast_cells, fast_pieces)
+        slow = _parse_rows(board, slow_cells, slow_pieces, False)
+        assert fast == slow, repr(board)
+        if fast[2] is None:
+            assert (fast_cells, fast_pieces) == (slow_cells, slow_pieces), repr(board)
+
+# =============================================================================
+#  24. Pre-screen  (ไม่มีศัตรูในแนวของ King → Fail โดยไม่ต้องยิง ray)
+# =============================================================================
+def test_prescreen_skips_unaligned():
+    """ศัตรูไม่อยู่ในแนวของ King เลย: ไม่ต้องเก็บ enemy_pieces"""
+    board = """\
+.R..
+...K
+B...
+..Q."""
+    cells, pieces = bytearray(), []
+    assert parse_into(board, cells, pieces, screen=True) == (4, 7, None)
+    assert pieces == []
+    assert run(board) == "Fail"
+
+def test_prescreen_keeps_aligned():
+    """มี Bishop ในแนวทแยงของ King (ถึงจะถูกบัง) ต้องตรวจต่อ"""
+    board = """\
+B...
+.P..
+..K.
+...."""
+    cells, pieces = bytearray(), []
+    parse_into(board, cells, pieces, screen=True)
+    assert pieces == [("B", 0), ("P", 5)]
+    assert run(board) == "Fail"
+
+# =============================================================================
+#  25. Stats  (ตัวนับ ray / ช่อง / เวลา เปิดเมื่อส่ง stats มา)
+# =============================================================================
+def test_stats_counts_rays():
+    """Rook ถูก Pawn บัง: ยิง 2 ray, ชนตัวขวาง 1 ครั้ง (engine scan)"""
+    board = """\
+R.PK
+....
+....
+...."""
+    stats = Stats()
+    assert evaluate(board, engine="scan", stats=stats).verdict == "Fail"
+    # R: ขวา (ชน P) + ลง 3 ช่อง, P(0,2): ขึ้นไม่ได้ → ไม่มี ray
+    assert (stats.boards, stats.rays, stats.squares, stats.blocked) == (1, 2, 5, 1)
+    assert stats.parse_ns > 0 and stats.scan_ns > 0
+
+def test_stats_screened_merge_reset():
+    a, b = Stats(), Stats()
+    list(checkmate_many(["K", "..\n.K"], stats=a))
+    list(checkmate_many(["RK\n.."], stats=b))
+    assert a.screened == 2
+    a.merge(b)
+    assert a.boards == 3 and a.screened == 2
+    a.reset()
+    assert a.as_dict() == Stats().as_dict()
+
+def test_stats_every_engine_counts_rays():
+    """engine ที่ไม่ได้เดินทีละช่อง (bitboard, indexed) ก็ต้องนับ ray"""
+    board = """\
+R.PK
+....
+....
+...."""
+    expected = {
+        "auto": (4, 8, 1),      # = reverse: Pawn 1 + ลง 3 ช่อง + ซ้าย (ชน P) + ทแยง 3 ช่อง
+        "bitboard": (5, 0, 1),  # Pawn 1 + 4 ทิศตรง (ไม่มีตัวทแยง ข้ามทั้งแนว)
+        "indexed": (9, 1, 1),   # Pawn 1 + nearest() 8 ทิศ
+    }
+    for engine, counts in expected.items():
+        stats = Stats()
+        assert evaluate(board, engine=engine, stats=stats).verdict == "Fail"
+        assert (stats.rays, stats.squares, stats.blocked) == counts, engine
+
+# =============================================================================
+#  Run all tests
+# =============================================================================
+if __name__ == "__main__":
+    import runtests
+    raise SystemExit(runtests.main([__file__]))
@@ -1,17 +1,26 @@
-from checkmate import checkmate
+from checkmate import checkmate, evaluate, ENGINES
+import vectorized
 import io, sys
 
 def run(board):
-    """capture stdout from checkmate(), return stripped string"""
-    buf = io.StringIO()
-    old = sys.stdout
-    sys.stdout = buf
-    try:
-        checkmate(board)
-    except Exception:
-        pass  # function should never crash
-    sys.stdout = old
-    return buf.getvalue().strip()
+    """evaluate() the board with every engine, check they agree,
+    return the message checkmate() would print ("" if it crashed)"""
+    names = list(ENGINES)
+    results = []
+    for engine in ENGINES:
+        try:
+            results.append(evaluate(board, engine=engine).message)
+        except Exception:
+            results.append("")  # function should never crash
+    if vectorized.np is not None:
+        names.append("vectorized")
+        try:
+            results.append(vectorized.evaluate_many([board])[0])
+        except Exception:
+            results.append("")
+    assert results.count(results[0]) == len(results), \
+        f"engines disagree: {dict(zip(names, results))}"
+    return results[0]
 
 def run_no_crash(board):
     """call checkmate() and just make sure it doesn't crash/hang.
@@ -559,108 +568,5 @@ def test_defense_board_with_null_byte():
 #  Run all tests
 # =============================================================================
 if __name__ == "__main__":
-    tests = [
-        # A: Wrong Input Types
-        ("A1: None input", test_none_input),
-        ("A2: Integer input", test_integer_input),
-        ("A3: List input", test_list_input),
-        ("A4: Boolean input", test_bool_input),
-        ("A5: Dict input", test_dict_input),
-        ("A6: Float input", test_float_input),
-        # B: Empty/Whitespace
-        ("B1: Empty string", test_empty_string),
-        ("B2: Only newlines", test_only_newlines),
-        ("B3: Only spaces", test_only_spaces),
-        ("B4: Tabs in board", test_tabs_in_board),
-        ("B5: Single newline", test_single_newline),
-        ("B6: Spaces as board", test_spaces_as_board),
-        # C: Trailing/Leading newlines
-        ("C1: Trailing newline", test_trailing_newline),
-        ("C2: Leading newline", test_leading_newline),
-        ("C3: Double trailing newline", test_double_trailing_newline),
-        ("C4: CRLF line endings", test_crlf_line_endings),
-        # D: Lowercase
-        ("D1: Lowercase pieces", test_lowercase_pieces),
-        ("D2: Lowercase king", test_lowercase_king),
-        # E: Unicode/Special
-        ("E1: Unicode Thai chars", test_unicode_chars),
-        ("E2: Emoji in board", test_emoji_in_board),
-        ("E3: Numbers in board", test_numbers_in_board),
-        ("E4: Special symbols", test_special_symbols),
-        # F: Board Size
-        ("F1: 0x0 board", test_0x0_board),
-        ("F2: 1x1 Pawn only", test_1x1_pawn),
-        ("F3: 1x1 dot", test_1x1_empty),
-        ("F4: 9x9 too big", test_9x9_board),
-        ("F5: Exactly 8x8", test_exactly_8x8),
-        ("F6: 3x5 not square", test_non_square_more_cols),
-        ("F7: 5x3 not square", test_non_square_more_rows),
-        ("F8: Uneven row lengths", test_uneven_row_lengths),
-        # G: Pawn Evil
-        ("G1: Pawn below King", test_pawn_directly_below_king),
-        ("G2: Pawn 2 rows above", test_pawn_two_rows_above_king),
-        ("G3: Pawn attacks up only", test_pawn_attacks_upward_only),
-        ("G4: Many pawns around King", test_many_pawns_surrounding_king),
-        ("G5: Pawn left edge", test_pawn_at_left_edge),
-        ("G6: Pawn right edge", test_pawn_at_right_edge),
-        # H: Complex Blocking
-        ("H1: Rook blocked by Rook", test_rook_blocked_by_own_kind),
-        ("H2: Queen enclosed by Pawns", test_queen_behind_pawn_all_directions),
-        ("H3: Bishop blocked at dist 1", test_bishop_blocked_at_distance_1),
-        ("H4: Multiple pieces blocked", test_multiple_pieces_different_blocks),
-        # I: King Position
-        ("I1: King at (0,0)", test_king_at_0_0),
-        ("I2: King at max corner", test_king_at_max_corner),
-        ("I3: King surrounded", test_king_surrounded_all_fail),
-        # J: Boundary
-        ("J1: Rook fires off edge", test_rook_fires_off_edge),
-        ("J2: Bishop at corner", test_bishop_at_corner),
-        ("J3: Queen corner diagonal", test_queen_at_corner_checks_diagonal),
-        # K: Stress
-        ("K1: No enemies", test_8_rooks_no_check),
-        ("K2: All pawns miss", test_all_pawns_around_king),
-        ("K3: Rooks on edges", test_rooks_on_every_edge),
-        # L: Fake boards
-        ("L1: Single R no King", test_single_char_not_king),
-        ("L2: Single dot", test_single_char_dot),
-        ("L3: All Kings", test_board_all_kings_invalid),
-        ("L4: Very long single line", test_very_long_single_line),
-        ("L5: Only enemies no King", test_only_enemy_pieces_no_king),
-        # M: Defense
-        ("M1: No args", test_defense_no_args),
-        ("M2: Extra args", test_defense_extra_args),
-        ("M3: Backslash in board", test_defense_board_with_backslash),
-        ("M4: Null byte in board", test_defense_board_with_null_byte),
-    ]
-
-    passed = 0
-    failed = 0
-    errors = []
-
-    print("=" * 60)
-    print("  EVIL / EDGE CASE TEST SUITE")
-    print("=" * 60)
-
-    for name, func in tests:
-        try:
-            func()
-            print(f"  [PASS] {name}")
-            passed += 1
-        except AssertionError as e:
-            print(f"  [FAIL] {name} - {e}")
-            failed += 1
-            errors.append((name, str(e)))
-        except Exception as e:
-            print(f"  [ERR!] {name} - {type(e).__name__}: {e}")
-            failed += 1
-            errors.append((name, f"{type(e).__name__}: {e}"))
-
-    print(f"\n{'=' * 60}")
-    print(f"  Results: {passed} passed, {failed} failed, {passed + failed} total")
-    if errors:
-        print(f"\n  Failed tests:")
-        for name, reason in errors:
-            print(f"    - {name}")
-            if reason:
-                print(f"      Reason: {reason}")
-    print(f"{'=' * 60}")
+    import runtests
+    raise SystemExit(runtests.main([__file__]))
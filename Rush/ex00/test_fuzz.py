@@ -0,0 +1,30 @@
+import random
+
+from fuzz import PATHS, disagrees, fuzz, minimize, mutate, outcomes
+
+def test_mutate_is_seeded():
+    board = "R...\n.K..\n..P.\n...."
+    a = [mutate(random.Random(i), board) for i in range(50)]
+    b = [mutate(random.Random(i), board) for i in range(50)]
+    assert a == b
+    assert any(not isinstance(x, str) for x in a)
+
+def test_checkmate_path_skips_non_strings():
+    found = outcomes(None)
+    assert "checkmate" not in found
+    assert set(found.values()) == {"Error: Board is not a string"}
+
+def test_minimize_finds_small_reproducer():
+    # path ปลอมที่ผิดเมื่อมี Queen บนบอร์ด
+    paths = {"reverse": PATHS["reverse"],
+             "buggy": lambda b: "Fail" if "Q" in b else PATHS["reverse"](b)}
+    board = "..P.\nR.K.\n....\n.Q.B"
+    assert disagrees(board, paths)
+    smallest = minimize(board, paths)
+    assert disagrees(smallest, paths)
+    assert len(smallest) < len(board) and "Q" in smallest
+
+def test_short_run_finds_nothing():
+    tried, failures = fuzz(seed=5, budget=0.3)
+    assert tried > 0
+    assert failures == []
@@ -0,0 +1,32 @@
+import io
+import random
+
+from checkmate import evaluate
+from generator import generate, random_board, write_boards
+from reader import read_boards
+
+def test_same_seed_same_boards():
+    assert list(generate(50, seed=7, size=(1, 8))) == list(generate(50, seed=7, size=(1, 8)))
+    assert list(generate(50, seed=7)) != list(generate(50, seed=8))
+
+def test_piece_counts():
+    board = random_board(random.Random(0), 5, counts={"R": 2, "Q": 1, "P": 3})
+    assert [board.count(p) for p in "KPBRQ"] == [1, 3, 0, 2, 1]
+    assert len(board.split("\n")) == 5
+
+def test_forced_verdict():
+    for verdict, expected in (("attacked", "Success"), ("safe", "Fail")):
+        for board in generate(30, seed=1, size=(2, 8), verdict=verdict):
+            assert evaluate(board).verdict == expected
+
+def test_junk_is_treated_as_empty():
+    boards = list(generate(30, seed=2, junk=0.5, density=0.0))
+    assert any(set(board) - set(".K\n") for board in boards)
+    assert all(evaluate(board).verdict == "Fail" for board in boards)
+
+def test_write_and_read_back():
+    boards = list(generate(20, seed=3, size=(1, 6), junk=0.1))
+    out = io.StringIO()
+    assert write_boards(out, boards) == 20
+    out.seek(0)
+    assert list(read_boards(out)) == boards
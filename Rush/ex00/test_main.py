@@ -0,0 +1,26 @@
+from checkmate import Stats
+from main import run_batch
+
+BOARDS = [
+    "R...\n.K..\n..P.\n....",
+    "..\n.K",
+    "KK",
+    "B..\n...\n..K",
+] * 5
+
+def test_run_batch_ordered():
+    results = list(run_batch(BOARDS, workers=2, chunk_size=3))
+    assert [i for i, _ in results] == list(range(len(BOARDS)))
+    assert [m for _, m in results[:4]] == [
+        "Success", "Fail", "Error: Board is not square", "Success"]
+
+def test_run_batch_unordered():
+    results = dict(run_batch(BOARDS, workers=2, chunk_size=3, ordered=False))
+    ordered = dict(run_batch(BOARDS, workers=1, chunk_size=7))
+    assert results == ordered
+
+def test_run_batch_collects_stats():
+    stats = Stats()
+    list(run_batch(BOARDS, workers=2, chunk_size=3, engine="scan", stats=stats))
+    assert stats.boards == len(BOARDS)
+    assert stats.rays > 0
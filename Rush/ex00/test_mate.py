@@ -0,0 +1,51 @@
+import random
+
+from checkmate import evaluate
+from mate import evaluate_mate
+
+def test_checkmate_with_defended_pieces():
+    # Rook ตี K, Queen คุ้มกัน Rook และคุมช่องที่เหลือ
+    result = evaluate_mate("KR\n.Q")
+    assert result.verdict == "Checkmate"
+    assert (result.piece, result.square) == ("R", (0, 1))
+
+def test_capture_undefended_checker():
+    assert evaluate_mate("K.\n.Q").verdict == "Check"
+
+def test_cannot_retreat_along_ray():
+    # K ถอยไปทางขวาตามแนวเดียวกับ Rook ไม่ได้ ถึงตอนนี้ K จะบังช่องนั้นอยู่ก็ตาม
+    assert evaluate_mate("R.K.\nRR..\n....\n....").verdict == "Checkmate"
+    assert evaluate_mate("R.K.\n....\n....\n....").verdict == "Check"
+
+def test_not_attacked_and_errors():
+    assert evaluate_mate("K.\n..").verdict == "Fail"
+    assert evaluate_mate("KK\n..").message == "Error: Can only have one King"
+    assert evaluate_mate(5).message == "Error: Board is not a string"
+
+def _naive(board, n):
+    """เทียบกับวิธีตรงไปตรงมา: ลองเดิน King ทุกช่องแล้วเรียก evaluate() ใหม่"""
+    cells = list(board.replace("\n", ""))
+    king = cells.index("K")
+    if evaluate(board).verdict != "Success":
+        return "Fail"
+    kr, kc = divmod(king, n)
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            r, c = kr + dr, kc + dc
+            if (dr or dc) and 0 <= r < n and 0 <= c < n:
+                trial = list(cells)
+                trial[king] = "."
+                trial[r * n + c] = "K"
+                moved = "\n".join("".join(trial[i * n:(i + 1) * n]) for i in range(n))
+                if evaluate(moved).verdict == "Fail":
+                    return "Check"
+    return "Checkmate"
+
+def test_matches_naive_search():
+    rng = random.Random(21)
+    for _ in range(3000):
+        n = rng.randint(2, 8)
+        cells = [rng.choice(".....PBRQ") for _ in range(n * n)]
+        cells[rng.randrange(n * n)] = "K"
+        board = "\n".join("".join(cells[r * n:(r + 1) * n]) for r in range(n))
+        assert evaluate_mate(board).verdict == _naive(board, n), board
@@ -0,0 +1,25 @@
+import random
+
+from perft import PATHS, measure, perft
+
+def test_known_counts():
+    board = "K..\n...\n..R"
+    assert perft(board, 0) == 1
+    assert perft(board, 1) == 3       # ช่องรอบ K ที่ Rook ไม่ได้ตี
+    assert perft(board, 2) == 12      # แต่ละตา Rook เดินได้ 4 แบบ
+    assert perft("KR\n.Q", 3) == 0    # โดนรุกจนตั้งแต่แรก
+
+def test_paths_agree():
+    rng = random.Random(22)
+    for _ in range(30):
+        n = rng.randint(3, 5)
+        cells = [rng.choice("......PBRQ") for _ in range(n * n)]
+        cells[rng.randrange(n * n)] = "K"
+        board = "\n".join("".join(cells[r * n:(r + 1) * n]) for r in range(n))
+        counts = {path: perft(board, 3, path) for path in PATHS}
+        assert len(set(counts.values())) == 1, (board, counts)
+
+def test_measure_reports_every_path():
+    report = measure("K..\n...\n..R", 2)
+    assert sorted(report) == sorted(PATHS)
+    assert all(stats["nodes"] == 12 for stats in report.values())
@@ -0,0 +1,93 @@
+import random
+
+from checkmate import evaluate, ENGINES
+from position import Position, evaluate_many
+
+def test_from_board_matches_evaluate():
+    board = "R...\n.K..\n..P.\n...."
+    position = Position.from_board(board)
+    assert position.is_attacked()
+    assert position.result().verdict == "Success"
+    assert position.to_board() == board
+
+def test_from_board_error():
+    try:
+        Position.from_board("KK\n..")
+    except ValueError as e:
+        assert str(e) == "Can only have one King"
+        return
+    assert False, "two kings should raise ValueError"
+
+def test_move_blocks_and_unblocks():
+    position = Position.from_board("R..K\n....\n.B..\n....")
+    assert position.is_attacked()
+    position.move((2, 1), (0, 1))       # Bishop มาบัง Rook
+    assert not position.is_attacked()
+    position.move((0, 1), (1, 2))       # หลบออก และ Bishop ก็ตี K ทแยงด้วย
+    assert position.result().verdict == "Success"
+
+def test_hash_is_path_independent():
+    """ได้บอร์ดเดียวกันด้วยการเดินคนละแบบ hash ต้องเท่ากัน"""
+    a = Position.from_board("R...\n.K..\n....\n....")
+    a.move((0, 0), (3, 0))
+    a.place((0, 3), 'Q')
+    b = Position.from_board("...Q\n.K..\n....\nR...")
+    assert a.hash == b.hash and a.to_board() == b.to_board()
+
+def test_random_moves_match_full_check():
+    """เดินสุ่มหลายพันครั้ง ผล incremental ต้องตรงกับการตรวจใหม่ทั้งบอร์ด"""
+    rng = random.Random(42)
+    for n in (1, 3, 5, 8):
+        position = Position(n)
+        position.place((rng.randrange(n), rng.randrange(n)), 'K')
+        for _ in range(400):
+            square = (rng.randrange(n), rng.randrange(n))
+            piece = position.piece_at(square)
+            if piece is None:
+                position.place(square, rng.choice("PBRQ" if position.king is not None else "K"))
+            elif piece == 'K' or rng.random() < 0.5:
+                target = (rng.randrange(n), rng.randrange(n))
+                if target != square:
+                    position.move(square, target)
+            else:
+                position.remove(square)
+            board = position.to_board()
+            expected = evaluate(board)
+            assert position.result().verdict == expected.verdict, board
+            if expected.verdict != "Error":
+                assert position.hash == Position.from_board(board).hash
+
+def test_slots_and_pack_round_trip():
+    rng = random.Random(3)
+    for n in (1, 3, 4, 7, 8):
+        for _ in range(50):
+            cells = [rng.choice(".....PBRQ") for _ in range(n * n)]
+            cells[rng.randrange(n * n)] = "K"
+            board = "\n".join("".join(cells[r * n:(r + 1) * n]) for r in range(n))
+            position = Position.from_board(board)
+            packed = position.pack()
+            assert len(packed) == (n * n + 1) // 2
+            other = Position.unpack(n, packed)
+            assert other.to_board() == board
+            assert other.hash == position.hash
+            assert other.result() == position.result()
+    assert not hasattr(position, "__dict__")
+
+def test_evaluate_many_matches_checkmate():
+    boards = ["R...\n.K..\n..P.\n....", "B..\n...\n..K", "..\n.K"]
+    positions = [Position.from_board(b) for b in boards]
+    for engine in ENGINES:
+        assert list(evaluate_many(positions, engine)) == [evaluate(b, engine) for b in boards]
+    assert positions[1].evaluate().verdict == "Success"
+
+def test_failed_move_leaves_position_unchanged():
+    position = Position.from_board("R..K\n....\n....\n....")
+    before = (position.to_board(), position.hash, position.result())
+    for start, end in (((0, 0), (9, 9)), ((1, 1), (2, 2)), ((-1, 0), (0, 1))):
+        try:
+            position.move(start, end)
+        except ValueError:
+            pass
+        else:
+            assert False, "move %r -> %r should raise ValueError" % (start, end)
+        assert (position.to_board(), position.hash, position.result()) == before
@@ -0,0 +1,38 @@
+import io
+import os
+import tempfile
+
+from reader import read_boards, check_boards
+
+def test_blank_line_separated():
+    """บอร์ดคั่นด้วยบรรทัดว่าง (กี่บรรทัดก็ได้)"""
+    lines = ["R.\n", ".K\n", "\n", "\n", "K\n"]
+    assert list(read_boards(lines)) == ["R.\n.K", "K"]
+
+def test_crlf_lines():
+    """บรรทัดแบบ Windows (\\r\\n) ต้องได้บอร์ดเหมือน \\n"""
+    lines = ["R...\r\n", ".K..\r\n", "..P.\r\n", "....\r\n", "\r\n", "K\r\n"]
+    assert list(read_boards(lines)) == ["R...\n.K..\n..P.\n....", "K"]
+
+def test_no_trailing_newline():
+    """บรรทัดสุดท้ายไม่มี newline ก็อ่านได้"""
+    stream = io.StringIO("..\n.K\n\nK")
+    assert list(read_boards(stream)) == ["..\n.K", "K"]
+
+def test_read_from_path():
+    """อ่านจาก path ของไฟล์ที่มี \r\n"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "boards.txt")
+        with open(path, "wb") as f:
+            f.write(b"R...\r\n.K..\r\n..P.\r\n....\r\n\r\n..\r\n.K\r\n")
+        assert [r.message for r in check_boards(path)] == ["Success", "Fail"]
+
+def test_lazy():
+    """ต้องไม่อ่านบรรทัดล่วงหน้าเกินบอร์ดที่ขอ"""
+    seen = []
+    def lines():
+        for line in ["K\n", "\n", "KK\n"]:
+            seen.append(line)
+            yield line
+    boards = read_boards(lines())
+    assert next(boards) == "K" and seen == ["K\n", "\n"]
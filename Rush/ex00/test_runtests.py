@@ -0,0 +1,46 @@
+import os
+import tempfile
+
+from runtests import discover, run_tests
+
+SAMPLE = '''\
+import os
+
+def test_ok():
+    print("hello")
+
+def test_fails():
+    assert 1 == 2, "one is not two"
+
+def test_raises():
+    {}["missing"]
+
+def test_hangs():
+    while True:
+        pass
+
+def test_dies():
+    os._exit(3)
+
+def helper():
+    pass
+'''
+
+def test_discover_and_run():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "test_sample_runner.py")
+        with open(path, "w") as f:
+            f.write(SAMPLE)
+        tests = discover([tmp])
+        assert [name for _, name in tests] == [
+            "test_ok", "test_fails", "test_raises", "test_hangs", "test_dies"]
+        assert [name for _, name in discover([path], "fail")] == ["test_fails"]
+        results = {r["name"]: r for r in run_tests(tests, workers=3, timeout=0.5)}
+    assert results["test_ok"]["status"] == "pass"
+    assert results["test_ok"]["output"] == "hello\n"
+    assert results["test_fails"]["status"] == "fail"
+    assert results["test_fails"]["message"].startswith("one is not two")
+    assert results["test_raises"]["status"] == "error"
+    assert results["test_hangs"]["status"] == "timeout"
+    assert results["test_dies"]["status"] == "crash"
+    assert all(r["seconds"] >= 0 for r in results.values())
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from checkmate import evaluate
+import server
+from server import CheckmateServer, Client
+
+BOARDS = ["R...\n.K..\n..P.\n....", "..\n.K", "KK", "B..\n...\n..K", 5] * 10
+
+def _run(coro):
+    return asyncio.run(coro)
+
+def test_in_process_batches():
+    """คำขอพร้อมกันหลายอันต้องได้ผลเหมือน evaluate() ทีละบอร์ด"""
+    async def scenario():
+        with ThreadPoolExecutor(2) as pool:
+            async with CheckmateServer(batch_size=8, executor=pool) as server:
+                return await asyncio.gather(*(server.evaluate(b) for b in BOARDS))
+    assert _run(scenario()) == [evaluate(b) for b in BOARDS]
+
+def test_tcp_round_trip():
+    async def scenario():
+        with ThreadPoolExecutor(2) as pool:
+            async with CheckmateServer(max_in_flight=4, executor=pool) as server:
+                listener = await server.start_tcp("127.0.0.1", 0)
+                port = listener.sockets[0].getsockname()[1]
+                client = await Client.connect_tcp("127.0.0.1", port)
+                replies = await asyncio.gather(*(client.check(b) for b in BOARDS))
+                await client.close()
+                return replies
+    replies = _run(scenario())
+    assert [r["message"] for r in replies] == [evaluate(b).message for b in BOARDS]
+    assert replies[0]["piece"] == "P" and replies[0]["square"] == [2, 2]
+
+def test_unix_bad_request():
+    async def scenario(path):
+        with ThreadPoolExecutor(1) as pool:
+            async with CheckmateServer(executor=pool) as server:
+                await server.start_unix(path)
+                reader, writer = await asyncio.open_unix_connection(path)
+                writer.write(b"not json\n")
+                line = await reader.readline()
+                writer.close()
+                return line
+    with tempfile.TemporaryDirectory() as tmp:
+        line = _run(scenario(os.path.join(tmp, "checkmate.sock")))
+    assert line == b'{"id": null, "error": "bad_request"}\n'
+
+def test_large_board_and_overlong_line():
+    """บอร์ดใหญ่ผ่านได้เมื่อ large=True บรรทัดที่ยาวเกิน limit ได้ bad_request
+    แต่ connection ยังใช้ต่อได้"""
+    big = "\n".join(["K" + "." * 299] + ["." * 300] * 299)
+    async def scenario():
+        with ThreadPoolExecutor(2) as pool:
+            async with CheckmateServer(executor=pool, large=True) as server:
+                listener = await server.start_tcp("127.0.0.1", 0)
+                port = listener.sockets[0].getsockname()[1]
+                client = await Client.connect_tcp("127.0.0.1", port)
+                large = await client.check(big)
+                await client.close()
+            async with CheckmateServer(executor=pool, line_limit=1024) as server:
+                listener = await server.start_tcp("127.0.0.1", 0)
+                port = listener.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(json.dumps({"id": 1, "board": big}).encode() + b"\n")
+                writer.write(b'{"id": 2, "board": "K"}\n')
+                lines = [await reader.readline(), await reader.readline()]
+                writer.close()
+        return large, lines
+    large, lines = _run(scenario())
+    assert large["message"] == "Fail"
+    assert json.loads(lines[0]) == {"id": None, "error": "bad_request"}
+    assert json.loads(lines[1])["message"] == "Fail"
+
+class _StuckWriter:
+    """writer ของ client ที่ไม่อ่านคำตอบเลย: drain() ไม่มีวันเสร็จ"""
+
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data):
+        self.written += 1
+
+    async def drain(self):
+        await asyncio.get_running_loop().create_future()
+
+    def close(self):
+        pass
+
+def test_slow_reader_stops_server_reading():
+    """client ที่ไม่อ่านคำตอบ ต้องไม่ทำให้มีคำตอบค้างเกิน max_in_flight
+    และ server ต้องหยุดอ่านคำขอที่เหลือ"""
+    async def scenario():
+        with ThreadPoolExecutor(2) as pool:
+            async with CheckmateServer(max_in_flight=8, executor=pool) as server:
+                reader = asyncio.StreamReader()
+                request = json.dumps({"id": 1, "board": "R...\n.K..\n..P.\n...."})
+                reader.feed_data((request.encode() + b"\n") * 100)
+                writer = _StuckWriter()
+                handler = asyncio.ensure_future(server._handle(reader, writer))
+                await asyncio.sleep(0.5)
+                handler.cancel()
+                return writer.written, len(reader._buffer)
+    written, unread = _run(scenario())
+    assert written == 8
+    assert unread > 0
+
+def test_batches_run_concurrently():
+    """หลาย batch ต้องถูกตรวจพร้อมกันได้ใน pool ไม่ใช่ทีละ batch"""
+    running = [0, 0]  # ตอนนี้, สูงสุด
+    lock = threading.Lock()
+    original = server._check_batch
+    def slow_batch(boards, engine, large):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return original(boards, engine, large)
+    async def scenario():
+        with ThreadPoolExecutor(4) as pool:
+            async with CheckmateServer(batch_size=2, executor=pool) as checker:
+                return await asyncio.gather(*(checker.evaluate(b) for b in BOARDS[:8]))
+    server._check_batch = slow_batch
+    try:
+        results = _run(scenario())
+    finally:
+        server._check_batch = original
+    assert results == [evaluate(b) for b in BOARDS[:8]]
+    assert running[1] > 1
+
+def test_worker_failure_gets_error_reply():
+    def broken(boards, engine, large):
+        raise RuntimeError("worker died")
+    async def scenario():
+        with ThreadPoolExecutor(1) as pool:
+            async with CheckmateServer(executor=pool) as checker:
+                listener = await checker.start_tcp("127.0.0.1", 0)
+                port = listener.sockets[0].getsockname()[1]
+                client = await Client.connect_tcp("127.0.0.1", port)
+                reply = await client.check("K")
+                await client.close()
+                return reply
+    original = server._check_batch
+    server._check_batch = broken
+    try:
+        reply = _run(scenario())
+    finally:
+        server._check_batch = original
+    assert reply == {"error": "server_error"}
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# ตรวจบอร์ดขนาดเดียวกันทีละหลายกระดานด้วย NumPy (ต้องติดตั้ง numpy)
+# บอร์ด B กระดาน ขนาด n x n เก็บเป็น array uint8 รูป (B, n, n) ช่องละ 1 code
+from math import isqrt
+
+try:
+    import numpy as np
+except ImportError:  # ยังใช้ส่วนอื่นของ checkmate ได้ตามปกติ
+    np = None
+
+from checkmate import ERRORS, MAX_SIZE, evaluate
+
+# code ของแต่ละช่อง ตัวที่ไม่ใช่ PBRQK เป็น EMPTY
+EMPTY, PAWN, ROOK, BISHOP, QUEEN, KING = range(6)
+_CODES = bytes(" PRBQK".find(chr(b)) if chr(b) in "PRBQK" else EMPTY
+               for b in range(256))
+
+# แบบเดียวกับ _CODES แต่ตัวขึ้นบรรทัดทุกแบบที่ splitlines() รู้จัก (ASCII) เป็น _BREAK
+_BREAK = 6
+_GROUP_CODES = bytes(_BREAK if b in b"\n\r\x0b\x0c\x1c\x1d\x1e" else code
+                     for b, code in enumerate(_CODES))
+
+# ผลของ check_batch
+ATTACKED = 1
+NOT_ATTACKED = 0
+NO_KING = -1
+TWO_KINGS = -2
+
+_MESSAGES = {
+    ATTACKED: "Success",
+    NOT_ATTACKED: "Fail",
+    NO_KING: "Error: " + ERRORS["no_king"],
+    TWO_KINGS: "Error: " + ERRORS["two_kings"],
+}
+_TOO_BIG = "Error: " + ERRORS["too_big"]
+if np is not None:
+    # ข้อความเรียงตามผล ใช้ array[ผล - TWO_KINGS] แทนการเปิด dict ทีละกระดาน
+    _MESSAGE_ARRAY = np.array([_MESSAGES[v] for v in range(TWO_KINGS, ATTACKED + 1)],
+                              dtype=object)
+
+# ทิศที่มองออกจาก King และ code ของตัวที่ตีได้จากทิศนั้น
+_KING_RAYS = (
+    ((-1, 0), (ROOK, QUEEN)), ((1, 0), (ROOK, QUEEN)),
+    ((0, -1), (ROOK, QUEEN)), ((0, 1), (ROOK, QUEEN)),
+    ((-1, -1), (BISHOP, QUEEN)), ((-1, 1), (BISHOP, QUEEN)),
+    ((1, -1), (BISHOP, QUEEN)), ((1, 1), (BISHOP, QUEEN)),
+)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("vectorized checking needs numpy (pip install numpy)")
+
+
+def encode(board):
+    """บอร์ดข้อความที่เป็นสี่เหลี่ยมจัตุรัส -> bytes ของ code ช่องละ 1 byte
+    คืน (n, bytes) หรือ None ถ้าไม่ใช่ string หรือไม่เป็นสี่เหลี่ยมจัตุรัส"""
+    if not isinstance(board, str):
+        return None
+    rows = board.splitlines()
+    n = len(rows)
+    for row in rows:
+        if len(row) != n:
+            return None
+    return n, "".join(rows).encode("ascii", "replace").translate(_CODES)
+
+
+def encode_group(boards, length):
+    """แปลงบอร์ดข้อความที่ยาว length เท่ากันทั้งหมดเป็น code ในทีเดียว
+    ต่อเป็นก้อนเดียวให้ทุกแถวลงท้ายด้วย '\\n' แล้ว translate รอบเดียว (ใน C)
+    คืน (n, codes รูป (B, n, n), array bool ว่าบอร์ดไหนใช้ได้) หรือ None
+    ถ้าทั้งกลุ่มใช้ทางนี้ไม่ได้ (ไม่ใช่ ASCII หรือความยาวไม่ตรงกับ n ไหน)"""
+    n = isqrt(length)
+    if n == 0 or length not in (n * n + n - 1, n * n + n):
+        return None
+    # บอร์ดที่ไม่มี '\n' ปิดท้ายใช้ '\n' ต่อกัน ทุกบอร์ดจะยาว n * (n + 1) เท่ากัน
+    separator = "\n" if length == n * n + n - 1 else ""
+    text = separator.join(boards) + separator
+    if not text.isascii():
+        return None
+    data = text.encode("ascii").translate(_GROUP_CODES)
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(len(boards), n, n + 1)
+    ends = rows[:, :, n] == _BREAK
+    if data.count(_BREAK) == len(boards) * n and ends.all():
+        valid = np.ones(len(boards), dtype=bool)
+    else:
+        # มีบางบอร์ดที่ตัวขึ้นบรรทัดอยู่ผิดที่ เช็คทีละบอร์ด
+        valid = ends.all(axis=1) & ~(rows[:, :, :n] == _BREAK).any(axis=(1, 2))
+    return n, rows[:, :, :n], valid
+
+
+def pack(encoded, n):
+    """รวม bytes ของบอร์ด n x n หลายกระดานเป็น array (B, n, n)"""
+    _require_numpy()
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8).reshape(-1, n, n)
+
+
+def check_batch(codes):
+    """ตรวจทั้ง batch พร้อมกัน codes รูป (B, n, n)
+    คืน array int8 ขนาด B: ATTACKED, NOT_ATTACKED, NO_KING หรือ TWO_KINGS"""
+    _require_numpy()
+    batch, n = codes.shape[0], codes.shape[1]
+    flat = codes.reshape(batch, n * n)
+    kings = flat == KING
+    king_count = kings.sum(axis=1)
+    attacked = np.zeros(batch, dtype=bool)
+
+    if n > 1:
+        king_r, king_c = np.divmod(kings.argmax(axis=1), n)
+        steps = np.arange(1, n)
+        rows = np.arange(batch)
+        for (dr, dc), attackers in _KING_RAYS:
+            # ช่องบนเส้นจาก King ออกไป ระยะ 1..n-1 (ช่องที่หลุดบอร์ดถือว่าว่าง)
+            r = king_r[:, None] + dr * steps
+            c = king_c[:, None] + dc * steps
+            inside = (r >= 0) & (r < n) & (c >= 0) & (c < n)
+            squares = np.where(inside, r * n + c, 0)
+            ray = np.where(inside, np.take_along_axis(flat, squares, axis=1), EMPTY)
+            # ตัวแรกที่ขวางบนเส้น (ตัวหลังจากนั้นถูกบังหมด)
+            occupied = ray != EMPTY
+            blocked = occupied.any(axis=1)
+            first = occupied.argmax(axis=1)
+            piece = ray[rows, first]
+            hit = blocked & np.isin(piece, attackers)
+            if dr == 1 and dc != 0:
+                # Pawn ที่อยู่ทแยงล่างติดกับ King ตีขึ้นมาได้
+                hit |= blocked & (first == 0) & (piece == PAWN)
+            attacked |= hit
+
+    result = np.where(attacked, ATTACKED, NOT_ATTACKED).astype(np.int8)
+    result[king_count == 0] = NO_KING
+    result[king_count > 1] = TWO_KINGS
+    return result
+
+
+def evaluate_many(boards, large=False):
+    """ตรวจบอร์ดหลายกระดาน คืน list ของข้อความแบบเดียวกับที่ checkmate() print
+    บอร์ดที่ยาวเท่ากันแปลงเป็น code พร้อมกันด้วย encode_group แล้วตรวจเป็น batch
+    บอร์ดที่ทางนั้นรับไม่ได้ (เช่น '\\r\\n' หรือไม่ใช่ ASCII) ใช้ encode ทีละกระดาน
+    ส่วนบอร์ดที่ไม่ใช่สี่เหลี่ยมจัตุรัสหรือไม่ใช่ string ส่งต่อให้ evaluate() ตามปกติ"""
+    _require_numpy()
+    boards = list(boards)
+    messages = np.empty(len(boards), dtype=object)
+    if set(map(type, boards)) <= {str}:
+        lengths = np.fromiter(map(len, boards), dtype=np.intp, count=len(boards))
+    else:
+        lengths = np.array([len(b) if isinstance(b, str) else -1 for b in boards],
+                           dtype=np.intp)
+    rest = [np.flatnonzero(lengths < 0)]
+    for length in np.unique(lengths[lengths >= 0]).tolist():
+        indexes = np.flatnonzero(lengths == length)
+        if len(indexes) == len(boards):
+            group = boards
+        else:
+            group = [boards[i] for i in indexes.tolist()]
+        encoded = encode_group(group, length)
+        if encoded is None:
+            rest.append(indexes)
+            continue
+        n, codes, valid = encoded
+        if not valid.all():
+            rest.append(indexes[~valid])
+            indexes, codes = indexes[valid], codes[valid]
+        _fill(messages, indexes, n, codes, large)
+
+    groups = {}  # n -> (ลำดับบอร์ด, bytes)
+    for index in np.concatenate(rest).tolist():
+        board = boards[index]
+        encoded = encode(board)
+        if encoded is None:
+            messages[index] = evaluate(board, large=large).message
+            continue
+        n, cells = encoded
+        indexes, batch = groups.setdefault(n, ([], []))
+        indexes.append(index)
+        batch.append(cells)
+    for n, (indexes, batch) in groups.items():
+        codes = pack(batch, n) if n else None
+        _fill(messages, indexes, n, codes, large)
+    return messages.tolist()
+
+
+def _fill(messages, indexes, n, codes, large):
+    """ตรวจ codes (บอร์ด n x n) แล้วใส่ข้อความผลลงใน messages ตาม indexes"""
+    if n == 0:
+        messages[indexes] = _MESSAGES[NO_KING]
+    elif n > MAX_SIZE and not large:
+        messages[indexes] = _TOO_BIG
+    else:
+        messages[indexes] = _MESSAGE_ARRAY[check_batch(codes) - TWO_KINGS]